@@ -10,6 +10,7 @@ executes the appropriate diskbench commands.
 import json
 import logging
 import os
+import platform
 import subprocess
 import sys
 import threading
@@ -35,6 +36,18 @@ for _p in possible_diskbench_paths:
         sys.path.insert(0, _p)
         break
 
+# Vendored FIO location - resolved once at import instead of per call
+REPO_ROOT = os.path.abspath(os.path.join(_base_dir, '..'))
+_machine = platform.machine().lower()
+VENDOR_FIO_DIR = os.path.join(
+    REPO_ROOT, 'vendor', 'fio', 'macos',
+    'arm64' if ('arm' in _machine or 'aarch64' in _machine) else 'x86_64'
+)
+VENDOR_FIO_CANDIDATES = (
+    os.path.join(VENDOR_FIO_DIR, 'fio'),
+    os.path.join(VENDOR_FIO_DIR, 'fio-noshm'),
+)
+
 class DiskBenchBridge:
 
     # ---------------------------------------------------------------------
@@ -44,20 +57,10 @@ class DiskBenchBridge:
         """Locate fio binary (prefer vendored) and return {'path': str, 'version': str}. Raises OSError."""
         if self._fio_checked:
             return self._fio_checked
-        import shutil, subprocess, platform as _platform
+        import shutil
         # Prefer vendored fio in repo
-        try:
-            repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-        except Exception:
-            repo_root = os.getcwd()
-        machine = _platform.machine().lower()
-        arch_dir = 'arm64' if ('arm' in machine or 'aarch64' in machine) else 'x86_64'
-        vendor_candidates = [
-            os.path.join(repo_root, 'vendor', 'fio', 'macos', arch_dir, 'fio'),
-            os.path.join(repo_root, 'vendor', 'fio', 'macos', arch_dir, 'fio-noshm'),
-        ]
         fio_path = None
-        for p in vendor_candidates:
+        for p in VENDOR_FIO_CANDIDATES:
             if os.path.exists(p) and os.access(p, os.X_OK):
                 fio_path = p
                 break
@@ -74,6 +77,9 @@ class DiskBenchBridge:
 
     """Bridge between web GUI and diskbench helper binary."""
     
+    # Shared environment for unsandboxed FIO execution, built once per process
+    _FIO_ENV: Optional[Dict[str, str]] = None
+    
     def __init__(self) -> None:
         self.diskbench_path: str = os.path.join(os.path.dirname(__file__), '..', 'diskbench')
         self.running_tests: Dict[str, Any] = {}
@@ -88,6 +94,20 @@ class DiskBenchBridge:
         # Discover and cleanup orphaned processes on startup
         self._discover_orphaned_processes()
     
+    @classmethod
+    def _fio_env(cls) -> Dict[str, str]:
+        """Return the cached FIO environment (no SHM, /tmp as TMPDIR, vendored FIO first on PATH)."""
+        env = cls._FIO_ENV
+        if env is None:
+            env = {
+                **os.environ,
+                'FIO_DISABLE_SHM': '1',
+                'TMPDIR': '/tmp',
+                'PATH': f"{VENDOR_FIO_DIR}:/opt/homebrew/bin:/usr/local/bin:{os.environ.get('PATH', '')}",
+            }
+            cls._FIO_ENV = env
+        return env
+    
     def _load_persistent_state(self):
         """Load persistent test state from disk."""
         try:
@@ -386,18 +406,14 @@ class DiskBenchBridge:
             env['FIO_DISABLE_SHM'] = '1'  # Disable shared memory
             env['TMPDIR'] = '/tmp'        # Use system tmp directory
             # Prepend vendored FIO path if available
-            machine = __import__('platform').machine().lower()
-            arch_dir = 'arm64' if ('arm' in machine or 'aarch64' in machine) else 'x86_64'
-            repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-            vendor_path = os.path.join(repo_root, 'vendor', 'fio', 'macos', arch_dir)
-            env['PATH'] = f"{vendor_path}:/opt/homebrew/bin:/usr/local/bin:{env.get('PATH', '')}"
+            env['PATH'] = f"{VENDOR_FIO_DIR}:/opt/homebrew/bin:/usr/local/bin:{env.get('PATH', '')}"
             
             # Ensure diskbench package is importable
-            env['PYTHONPATH'] = repo_root
+            env['PYTHONPATH'] = REPO_ROOT
             
             if log_callback:
                 log_callback('info', f"Environment: FIO_DISABLE_SHM=1, TMPDIR=/tmp")
-                log_callback('info', f"PATH includes vendor: {vendor_path}")
+                log_callback('info', f"PATH includes vendor: {VENDOR_FIO_DIR}")
             
             # Execute in diskbench directory with unsandboxed environment
             # Timeout based on test type - long tests need more time
@@ -766,16 +782,22 @@ rw={rw_mode}
             if test_id in self.running_processes:
                 process = self.running_processes[test_id]
                 
-                self.logger.info(f"Stopping test {test_id} (PID: {process.pid}, PGID: {os.getpgid(process.pid)})")
+                # Resolve the group once; it stays valid for FIO after the runner is reaped
+                pgid = os.getpgid(process.pid)
+                self.logger.info(f"Stopping test {test_id} (PID: {process.pid}, PGID: {pgid})")
                 
                 try:
                     # Kill the entire process group to ensure fio is terminated
-                    os.killpg(os.getpgid(process.pid), signal.SIGTERM)
-                    time.sleep(2) # Give it time to die
+                    os.killpg(pgid, signal.SIGTERM)
+                    # Give it time to die, returning as soon as the runner exits
+                    try:
+                        process.wait(timeout=2)
+                    except subprocess.TimeoutExpired:
+                        pass
                     # Check if it's still alive
-                    os.killpg(os.getpgid(process.pid), 0)
+                    os.killpg(pgid, 0)
                     # If it is, kill it with fire
-                    os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+                    os.killpg(pgid, signal.SIGKILL)
                     self.logger.info(f"Force-killed process group for test {test_id}")
                     process_killed = True
                 except (ProcessLookupError, OSError):
@@ -904,14 +926,7 @@ rw={rw_mode}
             cmd = [sys.executable, 'main.py'] + args
             
             # Set up environment for unsandboxed FIO execution
-            env = os.environ.copy()
-            env['FIO_DISABLE_SHM'] = '1'
-            env['TMPDIR'] = '/tmp'
-            machine = __import__('platform').machine().lower()
-            arch_dir = 'arm64' if ('arm' in machine or 'aarch64' in machine) else 'x86_64'
-            repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-            vendor_path = os.path.join(repo_root, 'vendor', 'fio', 'macos', arch_dir)
-            env['PATH'] = f"{vendor_path}:/opt/homebrew/bin:/usr/local/bin:{env.get('PATH', '')}"
+            env = self._fio_env()
             
             # Start process with process tracking
             process = subprocess.Popen(
@@ -1238,16 +1253,8 @@ rw={rw_mode}
             
             # Find FIO binary
             # Prefer vendored fio
-            import platform as _platform
-            machine = _platform.machine().lower()
-            arch_dir = 'arm64' if ('arm' in machine or 'aarch64' in machine) else 'x86_64'
-            repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-            vendor_candidates = [
-                os.path.join(repo_root, 'vendor', 'fio', 'macos', arch_dir, 'fio'),
-                os.path.join(repo_root, 'vendor', 'fio', 'macos', arch_dir, 'fio-noshm'),
-            ]
             fio_path = None
-            for path in vendor_candidates:
+            for path in VENDOR_FIO_CANDIDATES:
                 if os.path.exists(path) and os.access(path, os.X_OK):
                     fio_path = path
                     break
@@ -1285,17 +1292,10 @@ rw={rw_mode}
             
             try:
                 # Set up environment for unsandboxed FIO execution
-                env = os.environ.copy()
-                env['FIO_DISABLE_SHM'] = '1'  # Disable shared memory
-                env['TMPDIR'] = '/tmp'        # Use system tmp directory
-                machine = __import__('platform').machine().lower()
-                arch_dir = 'arm64' if ('arm' in machine or 'aarch64' in machine) else 'x86_64'
-                repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-                vendor_path = os.path.join(repo_root, 'vendor', 'fio', 'macos', arch_dir)
-                env['PATH'] = f"{vendor_path}:/opt/homebrew/bin:/usr/local/bin:{env.get('PATH', '')}"
+                env = self._fio_env()
                 
                 log_callback('info', 'Environment: FIO_DISABLE_SHM=1, TMPDIR=/tmp')
-                log_callback('info', f'PATH includes vendor: {vendor_path}')
+                log_callback('info', f'PATH includes vendor: {VENDOR_FIO_DIR}')
                 
                 # Build FIO command with maximum shared memory avoidance
                 fio_cmd = [
@@ -1305,36 +1305,32 @@ rw={rw_mode}
                     '--size=1M',
                     '--bs=4k',
                     '--rw=read',
-                    '--runtime=3',
-                    '--time_based=1',
+                    '--loops=1',            # Size-bounded: one pass over the file is enough for a liveness probe
                     '--ioengine=sync',
                     '--direct=0',
                     '--numjobs=1',
                     '--group_reporting=1',
-                    '--output-format=json',
                     '--disable_lat=1',      # Disable latency stats (uses shared memory)
                     '--disable_clat=1',     # Disable completion latency
                     '--disable_slat=1',     # Disable submission latency
                     '--disable_bw_measurement=1',  # Disable bandwidth measurement
-                    '--minimal',            # Minimal output
                     '--thread'              # Use threads instead of processes
                 ]
                 
                 log_callback('info', f'Executing FIO command: {" ".join(fio_cmd)}')
                 
-                # Run FIO test
+                # Run FIO test - only the return code and stderr matter, so stdout is discarded
                 result = subprocess.run(
                     fio_cmd,
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
                     text=True,
-                    timeout=30,
+                    timeout=5,
                     env=env
                 )
                 
                 log_callback('info', f'FIO test completed with return code: {result.returncode}')
                 
-                if result.stdout:
-                    log_callback('info', f'FIO STDOUT: {result.stdout[:500]}...')
                 if result.stderr:
                     log_callback('warning', f'FIO STDERR: {result.stderr}')
                 
@@ -1344,7 +1340,6 @@ rw={rw_mode}
                         'success': True,
                         'message': 'FIO functionality test passed',
                         'fio_path': fio_path,
-                        'test_output': result.stdout,
                         'logs': logs
                     }
                 else:
@@ -1417,16 +1412,8 @@ rw={rw_mode}
             
             # Find FIO binary
             # Prefer vendored fio
-            import platform as _platform
-            machine = _platform.machine().lower()
-            arch_dir = 'arm64' if ('arm' in machine or 'aarch64' in machine) else 'x86_64'
-            repo_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-            vendor_candidates = [
-                os.path.join(repo_root, 'vendor', 'fio', 'macos', arch_dir, 'fio'),
-                os.path.join(repo_root, 'vendor', 'fio', 'macos', arch_dir, 'fio-noshm'),
-            ]
             fio_path = None
-            for path in vendor_candidates:
+            for path in VENDOR_FIO_CANDIDATES:
                 if os.path.exists(path) and os.access(path, os.X_OK):
                     fio_path = path
                     break
@@ -2045,13 +2032,13 @@ rw={rw_mode}
                     
                     log_callback('info', '✅ FIO installed with sudo')
                 
-                # Make executable
-                chmod_result = subprocess.run([
-                    'chmod', '+x', target_path
-                ], capture_output=True, text=True, timeout=10)
-                
-                if chmod_result.returncode != 0:
-                    log_callback('warning', f'chmod failed: {chmod_result.stderr}')
+                # Make executable - copy2/cp keep the build's mode bits, so only chmod
+                # in-process when needed instead of forking a chmod binary
+                if not os.access(target_path, os.X_OK):
+                    try:
+                        os.chmod(target_path, 0o755)
+                    except OSError as e:
+                        log_callback('warning', f'chmod failed: {e}')
                 
                 # Final test of installed binary
                 log_callback('info', f'🔍 Testing installed FIO at {target_path}...')
@@ -10,6 +10,7 @@ import json
 import subprocess
 import shutil
 import tempfile
+import time
 import urllib.request
 import tarfile
 from pathlib import Path
@@ -17,13 +18,57 @@ from pathlib import Path
 from diskbench.utils.logging import get_logger
 from diskbench.utils.system_info import get_system_info
 
+__all__ = [
+    'SetupManager',
+    'handle_detect_command',
+    'handle_install_command',
+    'handle_validate_command',
+]
+
 logger = get_logger(__name__)
 
+# Human-readable status block printed by handle_detect_command
+_DETECT_STATUS_TEMPLATE = (
+    "System Status Detection:\n"
+    "  FIO Available: {fio_available}\n"
+    "  FIO Working: {fio_working}\n"
+    "  Disk Access: {disk_access}\n"
+    "  System Compatible: {system_compatible}\n"
+)
+_DETECT_STATUS_KEYS = ('fio_available', 'fio_working', 'disk_access', 'system_compatible')
+
+
+class _BufferedProgress:
+    """Progress callback that batches messages into one stdout write per stage."""
+
+    def __init__(self, quiet=False):
+        self.quiet = quiet
+        self.buf = []
+
+    def __call__(self, message):
+        if self.quiet:
+            return
+        self.buf.append(f"[{time.strftime('%H:%M:%S')}] {message}")
+
+    def flush(self):
+        if self.buf:
+            sys.stdout.write('\n'.join(self.buf) + '\n')
+            sys.stdout.flush()
+            self.buf.clear()
+
+
+def _flush_progress(progress_callback):
+    """Write out buffered progress before a blocking step so the user sees what is being waited on."""
+    flush = getattr(progress_callback, 'flush', None)
+    if flush:
+        flush()
+
 
 class SetupManager:
     def __init__(self):
         self.system_info = get_system_info()
         self.fio_path = None
+        self.last_usable = False  # system_usable from the latest detect_system_status()
 
     def detect_system_status(self):
         """Detect current system status and FIO availability."""
@@ -91,6 +136,7 @@ class SetupManager:
 
         # Consider system "usable" if FIO is available (even partially)
         status['system_usable'] = status['fio_available'] and (status['fio_working'] or status['fio_partial'])
+        self.last_usable = status['system_usable']
 
         return status
 
@@ -130,6 +176,7 @@ class SetupManager:
             progress_callback("🔧 Installing smartmontools via Homebrew...")
 
         # Check if already installed first
+        _flush_progress(progress_callback)
         if self._verify_smartmontools_installation():
             if progress_callback:
                 progress_callback("✅ smartmontools already installed and working")
@@ -161,6 +208,7 @@ class SetupManager:
             if progress_callback:
                 progress_callback(f"Command: {' '.join(brew_command)}")
 
+            _flush_progress(progress_callback)
             result = subprocess.run(brew_command, capture_output=True, text=True, timeout=300)
 
             if progress_callback:
@@ -179,6 +227,7 @@ class SetupManager:
 
             if any(success_indicators):
                 # Verify installation actually worked
+                _flush_progress(progress_callback)
                 if self._verify_smartmontools_installation():
                     if progress_callback:
                         progress_callback("✅ smartmontools installed and verified successfully")
@@ -245,6 +294,7 @@ class SetupManager:
             progress_callback("🔧 Phase 1: Homebrew FIO Installation...")
 
         # Check if Homebrew is installed
+        _flush_progress(progress_callback)
         homebrew_installed, homebrew_output = self._check_homebrew_detailed()
 
         if progress_callback:
@@ -269,6 +319,7 @@ class SetupManager:
 
             # Use sudo userspace approach for Homebrew
             brew_command = self._get_user_brew_command(['install', 'fio'])
+            _flush_progress(progress_callback)
             result = subprocess.run(brew_command, capture_output=True, text=True, timeout=300)
 
             if progress_callback:
@@ -291,6 +342,7 @@ class SetupManager:
                 if progress_callback:
                     progress_callback("🔍 Phase 2: Testing FIO shared memory compatibility...")
 
+                _flush_progress(progress_callback)
                 shm_test_result = self._test_fio_shm_support()
 
                 if shm_test_result['has_shm_issues']:
@@ -338,15 +390,6 @@ class SetupManager:
                 progress_callback("Try running manually: brew install fio")
             return False
 
-    def _check_homebrew(self):
-        """Check if Homebrew is installed."""
-        try:
-            result = subprocess.run(['brew', '--version'],
-                                    capture_output=True, text=True, timeout=10)
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
-            return False
-
     def _check_homebrew_detailed(self):
         """Check if Homebrew is installed with detailed output."""
         try:
@@ -436,20 +479,20 @@ class SetupManager:
                 '--size=1M',
                 '--bs=4k',
                 '--rw=read',
-                '--runtime=1',
-                '--time_based=1',
+                '--loops=1',        # size-bounded: SHM setup fails at startup, not mid-run
                 '--ioengine=sync',  # macOS-safe; avoid Linux-specific engines
                 '--direct=0',       # reduce SHM usage on macOS
                 '--numjobs=2',
-                '--group_reporting=1',
-                '--output-format=json'
+                '--group_reporting=1'
             ]
 
+            # Only the return code and stderr are inspected, so stdout is discarded
             result = subprocess.run(
                 fio_command,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=30
+                timeout=5
             )
 
             # Check for shared memory error
@@ -475,6 +518,14 @@ class SetupManager:
                     'error': result.stderr
                 }
 
+        except subprocess.TimeoutExpired:
+            # A slow first launch is no evidence of SHM trouble; rebuilding
+            # FIO from source for it would cost far more than it saves
+            logger.warning("FIO SHM test timed out")
+            return {
+                'has_shm_issues': False,
+                'reason': 'timeout'
+            }
         except Exception as e:
             logger.error(f"SHM test failed: {e}")
             return {
@@ -501,6 +552,7 @@ class SetupManager:
         try:
             # Use sudo userspace approach for Homebrew
             deps_cmd = self._get_user_brew_command(['install', 'automake', 'libtool'])
+            _flush_progress(progress_callback)
             result = subprocess.run(deps_cmd, capture_output=True, text=True, timeout=300)
             if result.returncode != 0:
                 logger.error(f"Failed to install dependencies: {result.stderr}")
@@ -521,12 +573,14 @@ class SetupManager:
             fio_url = 'https://github.com/axboe/fio/archive/refs/tags/fio-3.40.tar.gz'
             fio_tar = os.path.join(build_dir, 'fio.tar.gz')
 
+            _flush_progress(progress_callback)
             urllib.request.urlretrieve(fio_url, fio_tar)
 
             if progress_callback:
                 progress_callback("📦 Extracting FIO source...")
 
             # Extract
+            _flush_progress(progress_callback)
             with tarfile.open(fio_tar, 'r:gz') as tar:
                 tar.extractall(build_dir)
 
@@ -537,6 +591,7 @@ class SetupManager:
 
             # Configure without shared memory
             configure_cmd = ['./configure', '--disable-shm']
+            _flush_progress(progress_callback)
             result = subprocess.run(
                 configure_cmd,
                 cwd=fio_src_dir,
@@ -554,6 +609,7 @@ class SetupManager:
 
             # Compile
             make_cmd = ['make', '-j4']
+            _flush_progress(progress_callback)
             result = subprocess.run(
                 make_cmd,
                 cwd=fio_src_dir,
@@ -578,6 +634,8 @@ class SetupManager:
             # Copy with interactive sudo (no capture_output to allow password prompt)
             install_cmd = ['sudo', 'cp', fio_binary, install_path]
             try:
+                # The password prompt must follow the explanation, not precede it
+                _flush_progress(progress_callback)
                 result = subprocess.run(install_cmd, timeout=120)  # 2 minutes timeout for user input
 
                 if result.returncode != 0:
@@ -595,6 +653,7 @@ class SetupManager:
                     progress_callback("🔧 Setze Ausführungsrechte...")
 
                 chmod_cmd = ['sudo', 'chmod', '+x', install_path]
+                _flush_progress(progress_callback)
                 chmod_result = subprocess.run(chmod_cmd, timeout=60)
 
                 if chmod_result.returncode != 0:
@@ -618,6 +677,7 @@ class SetupManager:
                 progress_callback("🧪 Testing FIO-nosmh installation...")
 
             # Test the new binary
+            _flush_progress(progress_callback)
             test_result = subprocess.run(
                 [install_path, '--version'],
                 capture_output=True,
@@ -668,12 +728,22 @@ class SetupManager:
             logger.error(f"FIO binary test failed: {e}")
             tests['fio_binary_test'] = False
 
-        # Test 2: Disk Access Test
+        # Test 2: Disk Access Test (anonymous temp file - nothing left behind to clean up)
         try:
-            test_file = '/tmp/diskbench_access_test'
-            with open(test_file, 'w') as f:
-                f.write('test')
-            os.remove(test_file)
+            fd = None
+            if hasattr(os, 'O_TMPFILE'):
+                try:
+                    fd = os.open('/tmp', os.O_TMPFILE | os.O_WRONLY, 0o600)
+                except OSError:
+                    fd = None  # filesystem without O_TMPFILE support
+            if fd is None:
+                # macOS has no O_TMPFILE: unlink right away, the open fd stays writable
+                fd, test_file = tempfile.mkstemp(dir='/tmp', prefix='diskbench_access_')
+                os.unlink(test_file)
+            try:
+                os.write(fd, b'test')
+            finally:
+                os.close(fd)
             tests['disk_access_test'] = True
             logger.info("Disk access test: PASS")
         except Exception as e:
@@ -681,10 +751,14 @@ class SetupManager:
             tests['disk_access_test'] = False
 
         # Test 3: Performance Test (binary check only - no execution)
-        if self.fio_path:
+        # Short-circuit: it re-probes the same binary, so it cannot pass if Test 1 failed
+        if self.fio_path and tests['fio_binary_test']:
             tests['performance_test'] = self.check_fio_binary_only()
             logger.info(f"Performance test (binary check): {'PASS' if tests['performance_test'] else 'FAIL'}")
             logger.info("Note: FIO execution tests will run from bridge server")
+        elif self.fio_path:
+            logger.warning("Skipping performance test - FIO binary test failed")
+            tests['performance_test'] = False
         else:
             logger.warning("Skipping performance test - no FIO available")
             tests['performance_test'] = False
@@ -717,11 +791,8 @@ def handle_detect_command(args):
             'status': status
         }, indent=2))
     else:
-        print("System Status Detection:")
-        print(f"  FIO Available: {'✅' if status['fio_available'] else '❌'}")
-        print(f"  FIO Working: {'✅' if status['fio_working'] else '❌'}")
-        print(f"  Disk Access: {'✅' if status['disk_access'] else '❌'}")
-        print(f"  System Compatible: {'✅' if status['system_compatible'] else '❌'}")
+        marks = {key: '✅' if status[key] else '❌' for key in _DETECT_STATUS_KEYS}
+        sys.stdout.write(_DETECT_STATUS_TEMPLATE.format(**marks))
 
         if status['issues']:
             print("\nIssues found:")
@@ -729,20 +800,18 @@ def handle_detect_command(args):
                 print(f"  - {issue}")
 
     # Return success if system is usable (even with FIO limitations)
-    return 0 if status.get('system_usable', False) else 1
+    return 0 if setup_manager.last_usable else 1
 
 
 def handle_install_command(args):
     """Handle the install/fix all dependencies command."""
     setup_manager = SetupManager()
+    progress_callback = _BufferedProgress(quiet=getattr(args, 'quiet', False))
 
-    def progress_callback(message):
-        if not getattr(args, 'quiet', False):
-            print(f"[{time.strftime('%H:%M:%S')}] {message}")
-
-    import time
-
-    success = setup_manager.install_all_dependencies(progress_callback)
+    try:
+        success = setup_manager.install_all_dependencies(progress_callback)
+    finally:
+        progress_callback.flush()
 
     if args.json:
         print(json.dumps({
@@ -762,20 +831,21 @@ def handle_validate_command(args):
     """Handle the validation tests command."""
     setup_manager = SetupManager()
     tests = setup_manager.run_validation_tests()
+    all_passed = all(tests.values())
 
     if args.json:
         print(json.dumps({
-            'success': all(tests.values()),
+            'success': all_passed,
             'tests': tests
         }, indent=2))
     else:
-        print("Validation Test Results:")
-        for test_name, result in tests.items():
-            status = '✅ PASS' if result else '❌ FAIL'
-            readable_name = test_name.replace('_', ' ').title()
-            print(f"  {readable_name}: {status}")
-
-        overall = '✅ ALL TESTS PASSED' if all(tests.values()) else '❌ SOME TESTS FAILED'
-        print(f"\nOverall: {overall}")
+        lines = ["Validation Test Results:"]
+        lines.extend(
+            f"  {test_name.replace('_', ' ').title()}: {'✅ PASS' if result else '❌ FAIL'}"
+            for test_name, result in tests.items()
+        )
+        overall = '✅ ALL TESTS PASSED' if all_passed else '❌ SOME TESTS FAILED'
+        lines.append(f"\nOverall: {overall}\n")
+        sys.stdout.write('\n'.join(lines))
 
-    return 0 if all(tests.values()) else 1
+    return 0 if all_passed else 1
@@ -4,34 +4,85 @@ Test command for diskbench helper binary.
 
 import logging
 import os
-import tempfile
-import warnings
+import re
+import sys
+from bisect import bisect_left, bisect_right
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List
-from datetime import datetime
 
 from diskbench.core.fio_runner import FioRunner
 from diskbench.core.qlab_patterns import QLabTestPatterns
 from diskbench.utils.security import validate_disk_path, get_safe_test_directory, check_available_space
-from diskbench.utils.system_info import get_system_info
+from diskbench.utils.system_info import get_cached_system_info, local_timestamp
 
 logger = logging.getLogger(__name__)
 
+# Backward compatibility mapping from old test IDs to new ones (read-only, shared)
+_DEPRECATED_TEST_MAPPING = MappingProxyType({
+    'quick_max_speed': 'quick_max_mix',
+    'qlab_prores_422_show': 'prores_422_real',
+    'qlab_prores_hq_show': 'prores_422_hq_real',
+    'max_sustained': 'thermal_maximum'
+})
+
+# Placeholders supported in custom FIO config files, e.g. ${DISK_PATH}
+_PLACEHOLDER_RE = re.compile(r'\$\{(DISK_PATH|TEST_SIZE|TEST_SIZE_MB|TEST_SIZE_KB)\}')
+
+# Tier thresholds for _basic_analysis. IOPS tiers are strict lower bounds
+# (> threshold), latency tiers strict upper bounds in ms (< threshold).
+_READ_IOPS_THRESHOLDS = (5000, 20000, 50000)
+_WRITE_IOPS_THRESHOLDS = (3000, 15000, 40000)
+_IOPS_LABELS = ('poor', 'fair', 'good', 'excellent')
+_LATENCY_THRESHOLDS = (1, 5, 20)
+_LATENCY_LABELS = ('excellent', 'good', 'fair', 'poor')
+# Overall class from the summed per-metric scores (poor=1 .. excellent=4)
+_OVERALL_SCORE_THRESHOLDS = (4, 7, 10)
+
+# Recommendations keyed by performance class; unknown classes fall back to 'poor'
+_QLAB_RECOMMENDATIONS = {
+    'excellent': (
+        "✅ Excellent performance for QLab",
+        "✅ Suitable for complex shows with multiple video layers",
+        "✅ Can handle rapid cue triggering",
+        "✅ Good for 4K video content"
+    ),
+    'good': (
+        "✅ Good performance for most QLab applications",
+        "✅ Suitable for standard video playback",
+        "⚠️ May struggle with very complex shows",
+        "💡 Consider SSD upgrade for demanding applications"
+    ),
+    'fair': (
+        "⚠️ Fair performance - basic QLab usage only",
+        "⚠️ Pre-load cues when possible",
+        "⚠️ Avoid rapid cue sequences",
+        "💡 SSD upgrade recommended"
+    ),
+    'poor': (
+        "❌ Poor performance for QLab",
+        "❌ May experience dropouts and delays",
+        "❌ Not suitable for live performance",
+        "🔧 SSD upgrade strongly recommended"
+    ),
+}
+
+_BASIC_RECOMMENDATIONS = {
+    'excellent': ("✅ Excellent disk performance",),
+    'good': ("✅ Good disk performance",),
+    'fair': ("⚠️ Fair disk performance - consider upgrade",),
+    'poor': ("❌ Poor disk performance - upgrade recommended",),
+}
+
 
 class DiskTestCommand:
     """Command to execute disk performance tests."""
 
-    def __init__(self):
+    def __init__(self, prefer_io_uring: bool = True, isolate_cpus: bool = False):
         self.logger = logging.getLogger(__name__)
-        self.fio_runner = FioRunner()
+        self.fio_runner = FioRunner(prefer_io_uring=prefer_io_uring, isolate_cpus=isolate_cpus)
         self.qlab_patterns = QLabTestPatterns()
 
-        # Backward compatibility mapping from old test IDs to new ones
-        self.deprecated_test_mapping = {
-            'quick_max_speed': 'quick_max_mix',
-            'qlab_prores_422_show': 'prores_422_real',
-            'qlab_prores_hq_show': 'prores_422_hq_real',
-            'max_sustained': 'thermal_maximum'
-        }
+        self.deprecated_test_mapping = _DEPRECATED_TEST_MAPPING
 
     def stop_test(self):
         """Stop the currently running FIO test."""
@@ -39,7 +90,8 @@ class DiskTestCommand:
 
     def execute_builtin_test(self, disk_path: str, test_mode: str, test_size_gb: int,
                              output_file: str, show_progress: bool = False,
-                             json_output: bool = False, estimated_duration: int = 0) -> Optional[Dict[str, Any]]:
+                             json_output: bool = False, estimated_duration: int = 0,
+                             include_system_info: bool = True) -> Optional[Dict[str, Any]]:
         """
         Execute a built-in test pattern.
 
@@ -50,6 +102,8 @@ class DiskTestCommand:
             output_file: Output file path
             show_progress: Whether to show progress
             json_output: Whether to format as JSON
+            include_system_info: Whether to gather system info into the results
+                (batch callers that discard it can pass False; the key is then None)
 
         Returns:
             Test results or None on error
@@ -58,14 +112,16 @@ class DiskTestCommand:
             # Handle deprecated test IDs with backward compatibility
             original_test_mode = test_mode
             if test_mode in self.deprecated_test_mapping:
+                import warnings  # only needed on this rare path
+
                 new_test_mode = self.deprecated_test_mapping[test_mode]
-                self.logger.warning(f"Test ID '{test_mode}' is deprecated. Please use '{new_test_mode}' instead.")
-                warnings.warn(
+                self.logger.warning("Test ID '%s' is deprecated. Please use '%s' instead.",
+                                    test_mode, new_test_mode)
+                deprecation_message = (
                     f"Test ID '{test_mode}' is deprecated and will be removed in a future version. "
-                    f"Use '{new_test_mode}' instead.",
-                    DeprecationWarning,
-                    stacklevel=2
+                    f"Use '{new_test_mode}' instead."
                 )
+                warnings.warn(deprecation_message, DeprecationWarning, stacklevel=2)
                 test_mode = new_test_mode
 
             # Validate inputs
@@ -118,10 +174,10 @@ class DiskTestCommand:
                 return None
 
             # Check if FIO returned an error dictionary instead of results
-            if isinstance(fio_results, dict) and 'error' in fio_results:
+            # (run_fio_test returns Optional[Dict], so a non-empty result is a dict)
+            if 'error' in fio_results:
                 self.logger.error(f"FIO test failed with error: {fio_results['error']}")
                 self.logger.error(f"FIO stderr: {fio_results.get('fio_stderr', 'No stderr')}")
-                self.logger.error(f"FIO stdout: {fio_results.get('fio_stdout', 'No stdout')}")
                 return None
 
             # Analyze results for QLab
@@ -134,7 +190,7 @@ class DiskTestCommand:
                 'description': config['description'],
                 'disk_path': disk_path,
                 'test_size_gb': test_size_gb,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': local_timestamp(),
                 'test_directory': test_directory
             }
 
@@ -145,7 +201,7 @@ class DiskTestCommand:
 
             results = {
                 'test_info': test_info,
-                'system_info': get_system_info(),
+                'system_info': get_cached_system_info() if include_system_info else None,
                 'fio_results': fio_results,
                 'qlab_analysis': qlab_analysis,
                 'recommendations': self._generate_recommendations(qlab_analysis)
@@ -159,7 +215,8 @@ class DiskTestCommand:
 
     def execute_custom_test(self, disk_path: str, config_file: str, test_size_gb: int,
                             output_file: str, show_progress: bool = False,
-                            json_output: bool = False, estimated_duration: int = 0) -> Optional[Dict[str, Any]]:
+                            json_output: bool = False, estimated_duration: int = 0,
+                            include_system_info: bool = True) -> Optional[Dict[str, Any]]:
         """
         Execute a custom FIO configuration test.
 
@@ -170,6 +227,8 @@ class DiskTestCommand:
             output_file: Output file path
             show_progress: Whether to show progress
             json_output: Whether to format as JSON
+            include_system_info: Whether to gather system info into the results
+                (batch callers that discard it can pass False; the key is then None)
 
         Returns:
             Test results or None on error
@@ -189,13 +248,16 @@ class DiskTestCommand:
                 return None
 
             # Read custom config
-            with open(config_file, 'r') as f:
-                config_content = f.read()
+            with open(config_file, 'rb') as f:
+                config_data = f.read()
 
-            # Process config to inject disk path and size
-            processed_config = self._process_custom_config(
-                config_content, disk_path, test_size_gb
-            )
+            # Process config to inject disk path and size (only if it has placeholders)
+            if b'${' in config_data:
+                processed_config = self._process_custom_config(
+                    config_data.decode(), disk_path, test_size_gb
+                )
+            else:
+                processed_config = config_data.decode()
 
             # Create test directory
             base_path = self._get_test_base_path(disk_path)
@@ -239,11 +301,11 @@ class DiskTestCommand:
                     'description': f'Custom test from {config_file}',
                     'disk_path': disk_path,
                     'test_size_gb': test_size_gb,
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': local_timestamp(),
                     'test_directory': test_directory,
                     'config_file': config_file
                 },
-                'system_info': get_system_info(),
+                'system_info': get_cached_system_info() if include_system_info else None,
                 'fio_results': fio_results,
                 'analysis': basic_analysis,
                 'recommendations': self._generate_basic_recommendations(basic_analysis)
@@ -270,21 +332,16 @@ class DiskTestCommand:
     def _process_custom_config(self, config_content: str, disk_path: str,
                                test_size_gb: int) -> str:
         """Process custom config to inject disk path and size."""
-        # Replace placeholders in config
-        processed = config_content
-
-        # Common replacements
+        # Common replacements, applied in a single pass over the config
+        size_mb = test_size_gb * 1024
         replacements = {
-            '${DISK_PATH}': disk_path,
-            '${TEST_SIZE}': f'{test_size_gb}G',
-            '${TEST_SIZE_MB}': str(test_size_gb * 1024),
-            '${TEST_SIZE_KB}': str(test_size_gb * 1024 * 1024)
+            'DISK_PATH': disk_path,
+            'TEST_SIZE': str(test_size_gb) + 'G',
+            'TEST_SIZE_MB': str(size_mb),
+            'TEST_SIZE_KB': str(size_mb * 1024)
         }
 
-        for placeholder, value in replacements.items():
-            processed = processed.replace(placeholder, value)
-
-        return processed
+        return _PLACEHOLDER_RE.sub(lambda m: replacements[m.group(1)], config_content)
 
     def _progress_callback(self, progress_info: Dict[str, Any]):
         """Handle progress updates."""
@@ -292,132 +349,42 @@ class DiskTestCommand:
         elapsed = progress_info.get('elapsed_time', 0)
         status = progress_info.get('status', 'running')
 
-        print(f"\rProgress: {progress:.1f}% | Elapsed: {elapsed:.1f}s | Status: {status}", end='', flush=True)
-
-        if status == 'completed':
-            print()  # New line when completed
+        # One write per tick; newline only once the test has completed
+        out = sys.stdout
+        out.write("\rProgress: %.1f%% | Elapsed: %.1fs | Status: %s%s" % (
+            progress, elapsed, status, '\n' if status == 'completed' else ''))
+        out.flush()
 
     def _basic_analysis(self, fio_results: Dict[str, Any]) -> Dict[str, Any]:
         """Perform basic analysis of FIO results."""
         summary = fio_results.get('summary', {})
 
-        analysis = {
-            'performance_class': 'unknown',
-            'read_performance': 'unknown',
-            'write_performance': 'unknown',
-            'latency_performance': 'unknown',
-            'overall_score': 0
-        }
-
-        # Classify read performance
-        read_iops = summary.get('total_read_iops', 0)
-        if read_iops > 50000:
-            analysis['read_performance'] = 'excellent'
-        elif read_iops > 20000:
-            analysis['read_performance'] = 'good'
-        elif read_iops > 5000:
-            analysis['read_performance'] = 'fair'
-        else:
-            analysis['read_performance'] = 'poor'
-
-        # Classify write performance
-        write_iops = summary.get('total_write_iops', 0)
-        if write_iops > 40000:
-            analysis['write_performance'] = 'excellent'
-        elif write_iops > 15000:
-            analysis['write_performance'] = 'good'
-        elif write_iops > 3000:
-            analysis['write_performance'] = 'fair'
-        else:
-            analysis['write_performance'] = 'poor'
-
-        # Classify latency performance
+        # Classify read/write/latency performance via threshold lookup;
+        # the tier index doubles as the score (poor=0 .. excellent=3)
+        read_tier = bisect_left(_READ_IOPS_THRESHOLDS, summary.get('total_read_iops', 0))
+        write_tier = bisect_left(_WRITE_IOPS_THRESHOLDS, summary.get('total_write_iops', 0))
         avg_latency = (summary.get('avg_read_latency', 0) + summary.get('avg_write_latency', 0)) / 2
-        if avg_latency < 1:
-            analysis['latency_performance'] = 'excellent'
-        elif avg_latency < 5:
-            analysis['latency_performance'] = 'good'
-        elif avg_latency < 20:
-            analysis['latency_performance'] = 'fair'
-        else:
-            analysis['latency_performance'] = 'poor'
-
-        # Overall performance class
-        performance_scores = {
-            'excellent': 4,
-            'good': 3,
-            'fair': 2,
-            'poor': 1,
-            'unknown': 0
-        }
+        latency_index = bisect_right(_LATENCY_THRESHOLDS, avg_latency)
 
-        total_score = (performance_scores[analysis['read_performance']] +
-                       performance_scores[analysis['write_performance']] +
-                       performance_scores[analysis['latency_performance']])
+        # Overall performance class (each metric scores poor=1 .. excellent=4)
+        total_score = read_tier + write_tier + (3 - latency_index) + 3
 
-        analysis['overall_score'] = total_score
-
-        if total_score >= 10:
-            analysis['performance_class'] = 'excellent'
-        elif total_score >= 7:
-            analysis['performance_class'] = 'good'
-        elif total_score >= 4:
-            analysis['performance_class'] = 'fair'
-        else:
-            analysis['performance_class'] = 'poor'
+        analysis = {
+            'performance_class': _IOPS_LABELS[bisect_right(_OVERALL_SCORE_THRESHOLDS, total_score)],
+            'read_performance': _IOPS_LABELS[read_tier],
+            'write_performance': _IOPS_LABELS[write_tier],
+            'latency_performance': _LATENCY_LABELS[latency_index],
+            'overall_score': total_score
+        }
 
         return analysis
 
     def _generate_recommendations(self, qlab_analysis: Dict[str, Any]) -> List[str]:
         """Generate recommendations based on QLab analysis."""
-        recommendations = []
-
         overall = qlab_analysis.get('overall_performance', 'unknown')
-
-        if overall == 'excellent':
-            recommendations.extend([
-                "✅ Excellent performance for QLab",
-                "✅ Suitable for complex shows with multiple video layers",
-                "✅ Can handle rapid cue triggering",
-                "✅ Good for 4K video content"
-            ])
-        elif overall == 'good':
-            recommendations.extend([
-                "✅ Good performance for most QLab applications",
-                "✅ Suitable for standard video playback",
-                "⚠️ May struggle with very complex shows",
-                "💡 Consider SSD upgrade for demanding applications"
-            ])
-        elif overall == 'fair':
-            recommendations.extend([
-                "⚠️ Fair performance - basic QLab usage only",
-                "⚠️ Pre-load cues when possible",
-                "⚠️ Avoid rapid cue sequences",
-                "💡 SSD upgrade recommended"
-            ])
-        else:
-            recommendations.extend([
-                "❌ Poor performance for QLab",
-                "❌ May experience dropouts and delays",
-                "❌ Not suitable for live performance",
-                "🔧 SSD upgrade strongly recommended"
-            ])
-
-        return recommendations
+        return list(_QLAB_RECOMMENDATIONS.get(overall, _QLAB_RECOMMENDATIONS['poor']))
 
     def _generate_basic_recommendations(self, analysis: Dict[str, Any]) -> List[str]:
         """Generate basic recommendations."""
-        recommendations = []
-
         performance_class = analysis.get('performance_class', 'unknown')
-
-        if performance_class == 'excellent':
-            recommendations.append("✅ Excellent disk performance")
-        elif performance_class == 'good':
-            recommendations.append("✅ Good disk performance")
-        elif performance_class == 'fair':
-            recommendations.append("⚠️ Fair disk performance - consider upgrade")
-        else:
-            recommendations.append("❌ Poor disk performance - upgrade recommended")
-
-        return recommendations
+        return list(_BASIC_RECOMMENDATIONS.get(performance_class, _BASIC_RECOMMENDATIONS['poor']))
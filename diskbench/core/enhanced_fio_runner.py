@@ -4,37 +4,96 @@ Enhanced FIO runner with integrated monitoring and health checks.
 This extends the existing FioRunner with comprehensive monitoring,
 health checks, and performance tracking capabilities.
 """
+import functools
+import itertools
 import json
 import logging
 import os
+import re
 import subprocess
 import tempfile
+import threading
 import time
-import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 from .fio_runner import FioRunner
 from .monitoring import PerformanceMonitor
 from .health_checks import SystemHealthChecker, HealthStatus, HealthCheckResult
 
+# FIO config options surfaced as monitoring tags, mapped to their tag names
+_TAG_KEYS = {
+    'rw': 'rw_pattern',
+    'bs': 'block_size',
+    'size': 'test_size',
+    'runtime': 'runtime',
+    'numjobs': 'num_jobs',
+    'iodepth': 'io_depth',
+}
+# Seconds a health snapshot is served before a background refresh is started
+_HEALTH_SNAPSHOT_TTL = 10.0
+
+_TAG_RE = re.compile(r'^[ \t]*(rw|bs|size|runtime|numjobs|iodepth)=([^=\n]*)', re.M)
+
+# (metric name, FIO result key, unit) for metrics copied straight from results
+_JOB_READ_METRICS = (
+    ('fio_read_bandwidth_kbs', 'bw', 'kbs'),
+    ('fio_read_iops', 'iops', 'iops'),
+)
+_JOB_WRITE_METRICS = (
+    ('fio_write_bandwidth_kbs', 'bw', 'kbs'),
+    ('fio_write_iops', 'iops', 'iops'),
+)
+_JOB_CPU_METRICS = (
+    ('fio_cpu_user_percent', 'usr_cpu', 'percent'),
+    ('fio_cpu_system_percent', 'sys_cpu', 'percent'),
+)
+_SUMMARY_METRICS = (
+    ('fio_total_read_bandwidth_kbs', 'total_read_bw', 'kbs'),
+    ('fio_total_write_bandwidth_kbs', 'total_write_bw', 'kbs'),
+    ('fio_total_read_iops', 'total_read_iops', 'iops'),
+    ('fio_total_write_iops', 'total_write_iops', 'iops'),
+)
+
+# Shared read-only fallback for missing nested result sections; never mutate
+_EMPTY: Dict[str, Any] = {}
+
+
+def _lat_mean(stats: Dict[str, Any]) -> float:
+    """Mean latency in nanoseconds from a FIO read/write stats block."""
+    return (stats.get('lat_ns') or _EMPTY).get('mean', 0)
+
+
+def _check_name(check_func) -> str:
+    """Derive a health check name from its callable."""
+    return getattr(check_func, '__name__', 'unknown').replace('check_', '')
+
 
 class EnhancedFioRunner(FioRunner):
     """Enhanced FIO runner with monitoring and health check capabilities."""
     
-    def __init__(self, enable_monitoring: bool = True, enable_health_checks: bool = True):
+    # Source of per-process test IDs; next() on a count is atomic under the GIL
+    _test_counter = itertools.count()
+    
+    def __init__(self, enable_monitoring: bool = True, enable_health_checks: bool = True,
+                 prefer_io_uring: bool = True, isolate_cpus: bool = False):
         """
         Initialize enhanced FIO runner.
         
         Args:
             enable_monitoring: Enable performance monitoring and metrics collection
             enable_health_checks: Enable system health checks before tests
+            prefer_io_uring: Default for switching explicit posixaio/libaio
+                jobs to io_uring where the host supports it
+            isolate_cpus: Default for keeping FIO off the first CPU (Linux)
         """
         # Ensure logger exists even if base __init__ is patched in tests
         self.logger = logging.getLogger(__name__)
         
         # Initialize base FioRunner
-        super().__init__()
+        super().__init__(prefer_io_uring, isolate_cpus)
         
         # Initialize monitoring components
         self.monitoring_enabled = enable_monitoring
@@ -51,10 +110,17 @@ class EnhancedFioRunner(FioRunner):
             self.logger.info("Health checks enabled")
         else:
             self.health_checker = None
+        
+        # Cached health summary for get_monitoring_status
+        self._health_snapshot: Optional[Dict[str, Any]] = None
+        self._health_snapshot_ts = 0.0
+        self._health_refresh_lock = threading.Lock()
     
     def run_fio_test_enhanced(self, config_content: str, test_directory: str,
                             estimated_duration: int, progress_callback=None,
-                            test_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+                            test_name: Optional[str] = None,
+                            prefer_io_uring: Optional[bool] = None,
+                            isolate_cpus: Optional[bool] = None) -> Optional[Dict[str, Any]]:
         """
         Enhanced FIO test execution with monitoring and health checks.
         
@@ -64,12 +130,16 @@ class EnhancedFioRunner(FioRunner):
             estimated_duration: Estimated test duration in seconds
             progress_callback: Optional callback for progress updates
             test_name: Optional test name for better tracking
+            prefer_io_uring: Switch an explicit posixaio/libaio engine to
+                io_uring where supported; None uses the runner's setting
+            isolate_cpus: Keep FIO off the first CPU (Linux); None uses the
+                runner's setting
         
         Returns:
             Enhanced test results with monitoring data or None on error
         """
-        # Generate test ID
-        test_id = str(uuid.uuid4())[:8]
+        # Generate test ID (PID prefix keeps IDs distinct between concurrent processes)
+        test_id = f'{os.getpid() & 0xffff:04x}{next(self._test_counter) & 0xffff:04x}'
         if test_name:
             operation_name = f"{test_name}_{test_id}"
         else:
@@ -80,13 +150,13 @@ class EnhancedFioRunner(FioRunner):
         # Pre-test health checks
         if self.health_checks_enabled:
             health_results = self._perform_pre_test_health_checks(test_id)
-            if any(r.status == HealthStatus.CRITICAL for r in health_results):
-                critical_issues = [r.message for r in health_results if r.status == HealthStatus.CRITICAL]
+            critical_issues = [r.message for r in health_results if r.status == HealthStatus.CRITICAL]
+            if critical_issues:
                 self.logger.error(f"Critical health issues detected: {critical_issues}")
                 return {
                     'error': 'Pre-test health checks failed',
                     'critical_issues': critical_issues,
-                    'health_results': [r.__dict__ for r in health_results]
+                    'health_results': [r.to_dict() for r in health_results]
                 }
         
         # Extract test parameters for monitoring tags
@@ -98,18 +168,19 @@ class EnhancedFioRunner(FioRunner):
             if self.monitoring_enabled:
                 with self.monitor.measure_operation(operation_name, tags=tags):
                     result = super().run_fio_test(config_content, test_directory, 
-                                                 estimated_duration, progress_callback)
+                                                 estimated_duration, progress_callback,
+                                                 prefer_io_uring=prefer_io_uring,
+                                                 isolate_cpus=isolate_cpus)
             else:
                 result = super().run_fio_test(config_content, test_directory,
-                                            estimated_duration, progress_callback)
+                                            estimated_duration, progress_callback,
+                                            prefer_io_uring=prefer_io_uring,
+                                            isolate_cpus=isolate_cpus)
             
-            # Enhance results with monitoring data
-            if result and self.monitoring_enabled:
-                result = self._enhance_results_with_monitoring(result, test_id, operation_name)
-            
-            # Log test completion metrics
+            # Enhance successful results with monitoring data and log completion metrics
             if self.monitoring_enabled:
                 if result and 'error' not in result:
+                    result = self._enhance_results_with_monitoring(result, test_id, operation_name)
                     self.monitor.log_metric('fio_test_success', 1,
                                           tags=tags, unit='count')
                     self._log_test_performance_metrics(result, tags)
@@ -125,9 +196,9 @@ class EnhancedFioRunner(FioRunner):
             
             # Log failure metrics
             if self.monitoring_enabled:
+                exc_tags = {**tags, 'exception_type': type(e).__name__}
                 self.monitor.log_metric('fio_test_exception', 1,
-                                      tags={**tags, 'exception_type': type(e).__name__},
-                                      unit='count')
+                                      tags=exc_tags, unit='count')
             
             return {
                 'error': f'Test execution failed: {e}',
@@ -150,75 +221,96 @@ class EnhancedFioRunner(FioRunner):
             self.health_checker.check_cpu_usage
         ]
         
-        results = []
-        for check_func in critical_checks:
-            try:
-                result = check_func()
-                results.append(result)
+        # Each check probes an independent subsystem, so run them concurrently
+        # and report in declaration order. The first CRITICAL result already
+        # decides that the test will be rejected, so stop waiting on the rest.
+        results: List[Optional[HealthCheckResult]] = [None] * len(critical_checks)
+        executor = ThreadPoolExecutor(max_workers=len(critical_checks))
+        try:
+            futures = {
+                executor.submit(check_func): index
+                for index, check_func in enumerate(critical_checks)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                    
+                    if result.status == HealthStatus.CRITICAL:
+                        self.logger.warning(f"Critical health issue: {result.message}")
+                    elif result.status == HealthStatus.WARNING:
+                        self.logger.info(f"Health warning: {result.message}")
+                    else:
+                        self.logger.debug(f"Health check passed: {result.name}")
+                        
+                except Exception as e:
+                    self.logger.error(f"Health check failed: {e}")
+                    result = HealthCheckResult(
+                        name=_check_name(critical_checks[index]),
+                        status=HealthStatus.CRITICAL,
+                        message=f"Health check failed: {e}",
+                        details={'exception': str(e)},
+                        timestamp=time.time(),
+                        duration_ms=0
+                    )
+                results[index] = result
                 
                 if result.status == HealthStatus.CRITICAL:
-                    self.logger.warning(f"Critical health issue: {result.message}")
-                elif result.status == HealthStatus.WARNING:
-                    self.logger.info(f"Health warning: {result.message}")
-                else:
-                    self.logger.debug(f"Health check passed: {result.name}")
-                    
-            except Exception as e:
-                self.logger.error(f"Health check failed: {e}")
-                results.append(HealthCheckResult(
-                    name=check_func.__name__.replace('check_', ''),
-                    status=HealthStatus.CRITICAL,
-                    message=f"Health check failed: {e}",
-                    details={'exception': str(e)},
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Checks abandoned after a critical failure are reported as skipped
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = HealthCheckResult(
+                    name=_check_name(critical_checks[index]),
+                    status=HealthStatus.SKIPPED,
+                    message="Skipped after critical health issue",
+                    details={},
                     timestamp=time.time(),
                     duration_ms=0
-                ))
+                )
         
         # Log health check summary
         if self.monitoring_enabled:
-            healthy_count = sum(1 for r in results if r.status == HealthStatus.HEALTHY)
-            warning_count = sum(1 for r in results if r.status == HealthStatus.WARNING)
-            critical_count = sum(1 for r in results if r.status == HealthStatus.CRITICAL)
+            counts = Counter(r.status for r in results)
             
-            self.monitor.log_metric('pre_test_health_checks_healthy', healthy_count, unit='count')
-            self.monitor.log_metric('pre_test_health_checks_warnings', warning_count, unit='count')
-            self.monitor.log_metric('pre_test_health_checks_critical', critical_count, unit='count')
+            self.monitor.log_metric('pre_test_health_checks_healthy', counts[HealthStatus.HEALTHY], unit='count')
+            self.monitor.log_metric('pre_test_health_checks_warnings', counts[HealthStatus.WARNING], unit='count')
+            self.monitor.log_metric('pre_test_health_checks_critical', counts[HealthStatus.CRITICAL], unit='count')
         
         return results
     
     def _extract_test_tags(self, config_content: str, test_directory: str) -> Dict[str, str]:
         """Extract test parameters for monitoring tags."""
+        return dict(self._parse_config_tags(config_content, Path(test_directory).name))
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _parse_config_tags(config_content: str, dir_name: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        Parse monitoring tags from a FIO config.
+        
+        Cached because benchmark suites rerun identical configs; the result is
+        returned as a tuple of items so callers get a fresh dict each time.
+        """
         tags = {
-            'test_directory': str(Path(test_directory).name),
+            'test_directory': dir_name,
             'config_size_bytes': str(len(config_content))
         }
         
-        # Try to extract key parameters from config
-        try:
-            lines = config_content.strip().split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('rw='):
-                    tags['rw_pattern'] = line.split('=')[1]
-                elif line.startswith('bs='):
-                    tags['block_size'] = line.split('=')[1]
-                elif line.startswith('size='):
-                    tags['test_size'] = line.split('=')[1]
-                elif line.startswith('runtime='):
-                    tags['runtime'] = line.split('=')[1]
-                elif line.startswith('numjobs='):
-                    tags['num_jobs'] = line.split('=')[1]
-                elif line.startswith('iodepth='):
-                    tags['io_depth'] = line.split('=')[1]
-        except Exception as e:
-            self.logger.debug(f"Could not extract all config tags: {e}")
+        # Extract key parameters from config in a single pass
+        for match in _TAG_RE.finditer(config_content):
+            tags[_TAG_KEYS[match.group(1)]] = match.group(2).strip()
         
-        return tags
+        return tuple(tags.items())
     
     def _enhance_results_with_monitoring(self, result: Dict[str, Any], 
                                        test_id: str, operation_name: str) -> Dict[str, Any]:
         """Enhance test results with monitoring data."""
-        if not self.monitor:
+        # Failed results are reported as-is; skip the psutil sampling
+        if not self.monitor or not result or 'error' in result:
             return result
         
         # Get system metrics
@@ -233,12 +325,12 @@ class EnhancedFioRunner(FioRunner):
             'monitoring_enabled': True
         }
         
-        # Add performance summaries if available
-        for metric_name in self.monitor.metrics.keys():
-            if test_id in metric_name or operation_name in metric_name:
-                summary = self.monitor.get_metric_summary(metric_name)
-                if 'error' not in summary:
-                    result['monitoring'][f'{metric_name}_summary'] = summary
+        # Add performance summaries if available. Shared metric names such as
+        # fio_read_iops also hold other tests' values, so only this test's count
+        for metric_name in self.monitor.related_metrics(test_id, operation_name):
+            summary = self.monitor.get_metric_summary(metric_name, test_id=test_id)
+            if 'error' not in summary:
+                result['monitoring'][f'{metric_name}_summary'] = summary
         
         return result
     
@@ -248,6 +340,9 @@ class EnhancedFioRunner(FioRunner):
             return
         
         try:
+            # Collect all metrics first and hand them to the monitor in one batch
+            batch = []
+            
             # Log metrics for each job
             for i, job in enumerate(result.get('jobs', [])):
                 job_tags = {**tags, 'job_index': str(i), 'jobname': job.get('jobname', f'job_{i}')}
@@ -255,46 +350,34 @@ class EnhancedFioRunner(FioRunner):
                 # Read performance metrics
                 if 'read' in job:
                     read_stats = job['read']
-                    self.monitor.log_metric('fio_read_bandwidth_kbs', read_stats.get('bw', 0),
-                                          tags={**job_tags, 'io_type': 'read'}, unit='kbs')
-                    self.monitor.log_metric('fio_read_iops', read_stats.get('iops', 0),
-                                          tags={**job_tags, 'io_type': 'read'}, unit='iops')
-                    self.monitor.log_metric('fio_read_latency_ns', read_stats.get('lat_ns', {}).get('mean', 0),
-                                          tags={**job_tags, 'io_type': 'read'}, unit='nanoseconds')
+                    read_tags = {**job_tags, 'io_type': 'read'}
+                    for name, key, unit in _JOB_READ_METRICS:
+                        batch.append((name, read_stats.get(key, 0), read_tags, unit))
+                    batch.append(('fio_read_latency_ns', _lat_mean(read_stats),
+                                  read_tags, 'nanoseconds'))
                 
                 # Write performance metrics
                 if 'write' in job:
                     write_stats = job['write']
-                    self.monitor.log_metric('fio_write_bandwidth_kbs', write_stats.get('bw', 0),
-                                          tags={**job_tags, 'io_type': 'write'}, unit='kbs')
-                    self.monitor.log_metric('fio_write_iops', write_stats.get('iops', 0),
-                                          tags={**job_tags, 'io_type': 'write'}, unit='iops')
-                    self.monitor.log_metric('fio_write_latency_ns', write_stats.get('lat_ns', {}).get('mean', 0),
-                                          tags={**job_tags, 'io_type': 'write'}, unit='nanoseconds')
+                    write_tags = {**job_tags, 'io_type': 'write'}
+                    for name, key, unit in _JOB_WRITE_METRICS:
+                        batch.append((name, write_stats.get(key, 0), write_tags, unit))
+                    batch.append(('fio_write_latency_ns', _lat_mean(write_stats),
+                                  write_tags, 'nanoseconds'))
                 
                 # System utilization metrics
-                self.monitor.log_metric('fio_cpu_user_percent', job.get('usr_cpu', 0),
-                                      tags=job_tags, unit='percent')
-                self.monitor.log_metric('fio_cpu_system_percent', job.get('sys_cpu', 0),
-                                      tags=job_tags, unit='percent')
-                self.monitor.log_metric('fio_runtime_seconds', job.get('job_runtime', 0) / 1000.0,
-                                      tags=job_tags, unit='seconds')
+                for name, key, unit in _JOB_CPU_METRICS:
+                    batch.append((name, job.get(key, 0), job_tags, unit))
+                batch.append(('fio_runtime_seconds', job.get('job_runtime', 0) / 1000.0,
+                              job_tags, 'seconds'))
             
             # Overall test metrics
             if 'summary' in result:
                 summary = result['summary']
-                self.monitor.log_metric('fio_total_read_bandwidth_kbs', 
-                                      summary.get('total_read_bw', 0),
-                                      tags=tags, unit='kbs')
-                self.monitor.log_metric('fio_total_write_bandwidth_kbs',
-                                      summary.get('total_write_bw', 0),
-                                      tags=tags, unit='kbs')
-                self.monitor.log_metric('fio_total_read_iops',
-                                      summary.get('total_read_iops', 0),
-                                      tags=tags, unit='iops')
-                self.monitor.log_metric('fio_total_write_iops',
-                                      summary.get('total_write_iops', 0),
-                                      tags=tags, unit='iops')
+                for name, key, unit in _SUMMARY_METRICS:
+                    batch.append((name, summary.get(key, 0), tags, unit))
+            
+            self.monitor.log_metrics_batch(batch)
                 
         except Exception as e:
             self.logger.error(f"Failed to log performance metrics: {e}")
@@ -312,21 +395,53 @@ class EnhancedFioRunner(FioRunner):
             status['log_directory'] = str(self.monitor.log_dir)
             
         if self.health_checks_enabled and self.health_checker:
-            # Run quick health summary
-            try:
-                health_results = self.health_checker.run_all_checks()
-                health_summary = self.health_checker.get_health_summary(health_results)
-                status['health_summary'] = {
+            status.update(self._get_health_snapshot())
+        
+        return status
+    
+    def _get_health_snapshot(self) -> Dict[str, Any]:
+        """
+        Return the cached health summary, refreshing it when stale.
+        
+        The first call runs the checks synchronously. Afterwards a stale
+        snapshot is still returned immediately while a background thread
+        re-runs the checks, so status polling never waits on the full suite.
+        """
+        if self._health_snapshot is None:
+            self._refresh_health_snapshot()
+        
+        snapshot = self._health_snapshot
+        if (time.monotonic() - self._health_snapshot_ts >= _HEALTH_SNAPSHOT_TTL and
+                self._health_refresh_lock.acquire(blocking=False)):
+            def refresh():
+                try:
+                    self._refresh_health_snapshot()
+                finally:
+                    self._health_refresh_lock.release()
+            
+            threading.Thread(target=refresh, daemon=True).start()
+        
+        return snapshot
+    
+    def _refresh_health_snapshot(self):
+        """Run all health checks and store a summary snapshot."""
+        try:
+            health_results = self.health_checker.run_all_checks()
+            health_summary = self.health_checker.get_health_summary(health_results)
+            snapshot = {
+                'health_summary': {
                     'overall_status': health_summary['overall_status'],
                     'healthy': health_summary['healthy'],
                     'warnings': health_summary['warnings'],
                     'critical': health_summary['critical'],
                     'last_check': health_summary['timestamp']
                 }
-            except Exception as e:
-                status['health_check_error'] = str(e)
+            }
+        except Exception as e:
+            snapshot = {'health_check_error': str(e)}
         
-        return status
+        self._health_snapshot = snapshot
+        self._health_snapshot_ts = time.monotonic()
     
     def export_monitoring_data(self, output_file: Optional[str] = None) -> Optional[str]:
         """Export collected monitoring data to file."""
@@ -335,7 +450,10 @@ class EnhancedFioRunner(FioRunner):
             return None
         
         try:
-            export_path = self.monitor.export_metrics(output_file)
+            if output_file and Path(output_file).suffix in ('.jsonl', '.ndjson'):
+                export_path = self.monitor.export_metrics_jsonl(output_file)
+            else:
+                export_path = self.monitor.export_metrics(output_file)
             self.logger.info(f"Monitoring data exported to: {export_path}")
             return export_path
         except Exception as e:
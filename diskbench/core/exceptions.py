@@ -4,18 +4,61 @@ Custom exceptions with detailed context for diskbench.
 Provides structured error handling with context information and recovery hints
 for better debugging and user feedback.
 """
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
+
+# Characters of FIO output kept when an execution error is serialized
+_OUTPUT_TAIL_CHARS = 500
+
+
+def _truncate(value: Optional[Union[str, bytes]], limit: int,
+              tail: bool = False) -> Optional[Union[str, bytes]]:
+    """Return at most ``limit`` leading (or trailing) characters of ``value``."""
+    if not value:
+        return None
+    if len(value) <= limit:
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        view = memoryview(value)
+        return (view[-limit:] if tail else view[:limit]).tobytes()
+    return value[-limit:] if tail else value[:limit]
+
+
+def _restore_error(cls, args, context, recovery_hint, created):
+    """Rebuild a pickled or copied DiskBenchError without re-running ``__init__``."""
+    error = cls.__new__(cls, *args)
+    error.args = args
+    error.context = context
+    error.recovery_hint = recovery_hint
+    error._created = created
+    return error
 
 
 class DiskBenchError(Exception):
     """Base exception with context and recovery hints."""
     
+    # Slots keep these attributes out of the lazily created instance __dict__
+    __slots__ = ('context', 'recovery_hint', '_created')
+    
     def __init__(self, message: str, context: Optional[Dict[str, Any]] = None, recovery_hint: Optional[str] = None):
         super().__init__(message)
         self.context = context or {}
         self.recovery_hint = recovery_hint
-        self.timestamp = datetime.now().isoformat()
+        # Formatting is deferred to the timestamp property; most instances are
+        # caught and discarded without ever being serialized
+        self._created = time.time()
+    
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 local time at which the error was created."""
+        return datetime.fromtimestamp(self._created).isoformat()
+    
+    def __reduce__(self):
+        """Carry the slot attributes, which ``BaseException.__reduce__`` drops."""
+        return (_restore_error,
+                (self.__class__, self.args, self.context, self.recovery_hint, self._created),
+                getattr(self, '__dict__', None) or None)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for JSON serialization."""
@@ -31,20 +74,34 @@ class DiskBenchError(Exception):
 class FIOExecutionError(DiskBenchError):
     """FIO execution failed."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, return_code: Optional[int] = None, 
                  stdout: Optional[str] = None, stderr: Optional[str] = None):
         context = {
             'return_code': return_code,
-            'stdout': stdout[:500] if stdout else None,
-            'stderr': stderr[:500] if stderr else None
+            'stdout': stdout or None,
+            'stderr': stderr or None
         }
         recovery_hint = "Check FIO installation and parameters. Try running with --validate flag."
         super().__init__(message, context, recovery_hint)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert exception to dictionary, keeping only the tail of FIO output."""
+        data = super().to_dict()
+        data['context'] = {
+            **self.context,
+            'stdout': _truncate(self.context.get('stdout'), _OUTPUT_TAIL_CHARS, tail=True),
+            'stderr': _truncate(self.context.get('stderr'), _OUTPUT_TAIL_CHARS, tail=True)
+        }
+        return data
 
 
 class DiskNotAvailableError(DiskBenchError):
     """Target disk not available or accessible."""
     
+    __slots__ = ()
+    
     def __init__(self, disk_path: str, reason: str = ""):
         message = f"Disk not available: {disk_path}"
         if reason:
@@ -58,6 +115,8 @@ class DiskNotAvailableError(DiskBenchError):
 class InsufficientSpaceError(DiskBenchError):
     """Not enough disk space for test."""
     
+    __slots__ = ()
+    
     def __init__(self, required_gb: float, available_gb: float, disk_path: str):
         message = f"Insufficient space: need {required_gb}GB, have {available_gb}GB available"
         context = {
@@ -72,6 +131,8 @@ class InsufficientSpaceError(DiskBenchError):
 class InvalidTestConfigError(DiskBenchError):
     """Invalid test configuration or parameters."""
     
+    __slots__ = ()
+    
     def __init__(self, config_issue: str, test_id: Optional[str] = None):
         message = f"Invalid test configuration: {config_issue}"
         context = {'test_id': test_id, 'config_issue': config_issue}
@@ -82,6 +143,8 @@ class InvalidTestConfigError(DiskBenchError):
 class JSONParsingError(DiskBenchError):
     """Failed to parse FIO JSON output."""
     
+    __slots__ = ()
+    
     def __init__(self, parse_error: str, line_no: Optional[int] = None, 
                  column_no: Optional[int] = None, content_preview: Optional[str] = None):
         message = f"JSON parsing failed: {parse_error}"
@@ -89,7 +152,7 @@ class JSONParsingError(DiskBenchError):
             'parse_error': parse_error,
             'line_no': line_no,
             'column_no': column_no,
-            'content_preview': content_preview[:200] if content_preview else None
+            'content_preview': _truncate(content_preview, 200)
         }
         recovery_hint = "FIO output may be corrupted. Try re-running the test or check FIO version."
         super().__init__(message, context, recovery_hint)
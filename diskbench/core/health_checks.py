@@ -4,11 +4,16 @@ System health checks for diskbench monitoring.
 Provides comprehensive health monitoring including disk health,
 system resources, dependencies, and operational status checks.
 """
+import functools
+import json
 import os
 import subprocess
 import shutil
+import threading
 import time
 import psutil
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
@@ -16,6 +21,90 @@ from enum import Enum
 
 from .monitoring import PerformanceMonitor
 
+# Exit status bit smartctl sets when it cannot parse its command line
+_SMARTCTL_COMMAND_LINE_ERROR = 0x01
+
+# Upper bound for a full run_all_checks pass. smartctl alone may take 10s for
+# the scan plus 5s per device, so this leaves headroom above that.
+_CHECKS_TIMEOUT_SECONDS = 30.0
+
+# Seconds a check result is reused by run_all_checks. Fast-moving metrics are
+# only briefly cached; the FIO binary practically never changes at runtime.
+_CHECK_TTL_SECONDS = {
+    'disk_health': 30.0,
+    'memory_usage': 5.0,
+    'cpu_usage': 5.0,
+    'disk_space': 10.0,
+    'fio_dependency': 300.0,
+    'system_temperatures': 30.0,
+    'disk_io_performance': 5.0,
+    'network_connectivity': 30.0,
+    'process_health': 10.0,
+}
+
+# Seconds one partition scan is shared between the disk health and disk
+# space checks, which run side by side in run_all_checks
+_DISK_SNAPSHOT_TTL_SECONDS = 2.0
+
+# CPU and disk I/O rates are deltas against the previous sample kept on the
+# checker. The first call has no baseline and samples over this interval;
+# later calls only wait if the previous sample is more recent than it.
+_SAMPLE_INTERVAL_SECONDS = 0.5
+
+# cpu_times fields that count as idle, and guest time already included in user
+_CPU_IDLE_FIELDS = frozenset({'idle', 'iowait'})
+_CPU_GUEST_FIELDS = frozenset({'guest', 'guest_nice'})
+
+
+def _cpu_busy_percent(before, after) -> float:
+    """System-wide CPU busy percentage between two ``psutil.cpu_times()`` samples."""
+    total = idle = 0.0
+    for field, start, end in zip(after._fields, before, after):
+        delta = max(end - start, 0.0)
+        if field in _CPU_GUEST_FIELDS:
+            continue
+        total += delta
+        if field in _CPU_IDLE_FIELDS:
+            idle += delta
+    if total <= 0:
+        return 0.0
+    return round((total - idle) / total * 100, 1)
+
+
+def _smart_health_passed(output: str) -> Optional[bool]:
+    """
+    Read the overall SMART verdict from ``smartctl -H`` output.
+    
+    Uses the JSON ``smart_status`` when smartctl supports ``-j`` and falls
+    back to the PASSED/FAILED text of older versions.
+    
+    Returns:
+        True or False for a verdict, None if the output has none
+    """
+    try:
+        status = json.loads(output).get('smart_status') or {}
+    except (ValueError, AttributeError):
+        status = {}
+    if 'passed' in status:
+        return bool(status['passed'])
+    if 'PASSED' in output:
+        return True
+    if 'FAILED' in output:
+        return False
+    return None
+
+
+def _needs_text_retry(output: str, returncode: int) -> bool:
+    """Tell whether ``smartctl -H -j`` came from a smartctl without ``-j`` (before 7.0)."""
+    if returncode & _SMARTCTL_COMMAND_LINE_ERROR:
+        return True
+    try:
+        json.loads(output)
+    except ValueError:
+        return True
+    return False
+
+
 
 class HealthStatus(Enum):
     """Health check status levels."""
@@ -23,17 +112,30 @@ class HealthStatus(Enum):
     WARNING = "warning"
     CRITICAL = "critical"
     UNKNOWN = "unknown"
+    SKIPPED = "skipped"
 
 
 @dataclass
 class HealthCheckResult:
     """Result of a health check operation."""
+    __slots__ = ('name', 'status', 'message', 'details', 'timestamp', 'duration_ms')
+    
     name: str
     status: HealthStatus
     message: str
     details: Dict[str, Any]
     timestamp: float
     duration_ms: float
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert result to a compact JSON-serializable dictionary (without details)."""
+        return {
+            'name': self.name,
+            'status': self.status.value,
+            'message': self.message,
+            'timestamp': self.timestamp,
+            'duration_ms': self.duration_ms
+        }
 
 
 class SystemHealthChecker:
@@ -63,69 +165,141 @@ class SystemHealthChecker:
             'temperature_warning_celsius': 80,
             'temperature_critical_celsius': 90
         }
+        
+        # Check name -> (monotonic time, result) of the last completed run
+        self._cache: Dict[str, Tuple[float, HealthCheckResult]] = {}
+        self._disk_snapshot: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._disk_snapshot_lock = threading.Lock()
+        # (monotonic time, psutil sample) baselines for rate-based checks
+        self._last_cpu_sample: Optional[Tuple[float, Any]] = None
+        self._last_io_sample: Optional[Tuple[float, Any]] = None
+    
+    @functools.cached_property
+    def _fio_path(self) -> Optional[str]:
+        """FIO executable on PATH, looked up once per checker."""
+        return shutil.which('fio')
+    
+    @functools.cached_property
+    def _smartctl_path(self) -> Optional[str]:
+        """smartctl executable on PATH, looked up once per checker."""
+        return shutil.which('smartctl')
+    
+    def invalidate_tool_cache(self):
+        """Forget the FIO and smartctl locations, e.g. after installing them."""
+        self.__dict__.pop('_fio_path', None)
+        self.__dict__.pop('_smartctl_path', None)
+        self.invalidate('fio_dependency')
+        self.invalidate('disk_health')
+    
+    def invalidate(self, name: Optional[str] = None):
+        """
+        Drop cached check results so the next run measures them again.
+        
+        Args:
+            name: Check to invalidate, e.g. ``'disk_space'``. If None, all checks.
+        """
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(name, None)
     
     def run_all_checks(self) -> List[HealthCheckResult]:
         """
         Run all available health checks.
         
+        Results younger than their check's TTL are reused instead of being
+        measured again; see ``invalidate`` to force a refresh.
+        
         Returns:
             List of health check results
         """
         checks = [
-            self.check_disk_health,
-            self.check_memory_usage,
-            self.check_cpu_usage,
-            self.check_disk_space,
-            self.check_fio_dependency,
-            self.check_system_temperatures,
-            self.check_disk_io_performance,
-            self.check_network_connectivity,
-            self.check_process_health
+            ('disk_health', self.check_disk_health),
+            ('memory_usage', self.check_memory_usage),
+            ('cpu_usage', self.check_cpu_usage),
+            ('disk_space', self.check_disk_space),
+            ('fio_dependency', self.check_fio_dependency),
+            ('system_temperatures', self.check_system_temperatures),
+            ('disk_io_performance', self.check_disk_io_performance),
+            ('network_connectivity', self.check_network_connectivity),
+            ('process_health', self.check_process_health)
         ]
         
-        results = []
+        results: List[Optional[HealthCheckResult]] = [None] * len(checks)
         start_time = time.time()
+        now = time.monotonic()
+        
+        pending = []
+        for index, (name, check_func) in enumerate(checks):
+            cached = self._cache.get(name)
+            if cached and now - cached[0] < _CHECK_TTL_SECONDS.get(name, 0):
+                results[index] = cached[1]
+            else:
+                pending.append(index)
         
-        for check_func in checks:
+        # Checks are independent and mostly wait on sleeps, psutil syscalls
+        # or subprocesses, so run them concurrently and report in declaration
+        # order. Wall time becomes that of the slowest check, not the sum.
+        if pending:
+            executor = ThreadPoolExecutor(max_workers=len(pending))
             try:
-                result = check_func()
-                results.append(result)
-                
-                # Log metrics if monitor available
-                if self.monitor:
-                    self.monitor.log_metric(
-                        f'health_check_{result.name}_duration_ms',
-                        result.duration_ms,
-                        tags={
-                            'status': result.status.value,
-                            'check_name': result.name
-                        },
-                        unit='milliseconds'
-                    )
-                    
-            except Exception as e:
-                error_result = HealthCheckResult(
-                    name=check_func.__name__.replace('check_', ''),
-                    status=HealthStatus.CRITICAL,
-                    message=f"Health check failed: {e}",
-                    details={'exception': str(e), 'exception_type': type(e).__name__},
+                futures = {executor.submit(checks[index][1]): index for index in pending}
+                try:
+                    for future in as_completed(futures, timeout=_CHECKS_TIMEOUT_SECONDS):
+                        index = futures[future]
+                        try:
+                            result = future.result()
+                            self._cache[checks[index][0]] = (time.monotonic(), result)
+                            
+                            # Log metrics if monitor available
+                            if self.monitor:
+                                self.monitor.log_metric(
+                                    f'health_check_{result.name}_duration_ms',
+                                    result.duration_ms,
+                                    tags={
+                                        'status': result.status.value,
+                                        'check_name': result.name
+                                    },
+                                    unit='milliseconds'
+                                )
+                                
+                        except Exception as e:
+                            result = HealthCheckResult(
+                                name=checks[index][0],
+                                status=HealthStatus.CRITICAL,
+                                message=f"Health check failed: {e}",
+                                details={'exception': str(e), 'exception_type': type(e).__name__},
+                                timestamp=time.time(),
+                                duration_ms=0
+                            )
+                        results[index] = result
+                except FuturesTimeoutError:
+                    pass
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+        
+        # Checks still running at the deadline are reported, not waited on
+        for index, result in enumerate(results):
+            if result is None:
+                results[index] = HealthCheckResult(
+                    name=checks[index][0],
+                    status=HealthStatus.UNKNOWN,
+                    message=f"Health check timed out after {_CHECKS_TIMEOUT_SECONDS:.0f}s",
+                    details={'timeout_seconds': _CHECKS_TIMEOUT_SECONDS},
                     timestamp=time.time(),
-                    duration_ms=0
+                    duration_ms=(time.time() - start_time) * 1000
                 )
-                results.append(error_result)
         
         total_duration = (time.time() - start_time) * 1000
         
         # Log overall health check metrics
         if self.monitor:
-            healthy_count = sum(1 for r in results if r.status == HealthStatus.HEALTHY)
-            warning_count = sum(1 for r in results if r.status == HealthStatus.WARNING)
-            critical_count = sum(1 for r in results if r.status == HealthStatus.CRITICAL)
+            counts = Counter(r.status for r in results)
             
             self.monitor.log_metric('health_checks_total_duration_ms', total_duration, unit='milliseconds')
-            self.monitor.log_metric('health_checks_healthy_count', healthy_count, unit='count')
-            self.monitor.log_metric('health_checks_warning_count', warning_count, unit='count')
-            self.monitor.log_metric('health_checks_critical_count', critical_count, unit='count')
+            self.monitor.log_metric('health_checks_healthy_count', counts[HealthStatus.HEALTHY], unit='count')
+            self.monitor.log_metric('health_checks_warning_count', counts[HealthStatus.WARNING], unit='count')
+            self.monitor.log_metric('health_checks_critical_count', counts[HealthStatus.CRITICAL], unit='count')
         
         self.last_check_time = time.time()
         return results
@@ -136,20 +310,17 @@ class SystemHealthChecker:
         
         try:
             # Get disk usage information
-            disks_info = []
-            for disk_partition in psutil.disk_partitions():
-                try:
-                    usage = psutil.disk_usage(disk_partition.mountpoint)
-                    disks_info.append({
-                        'device': disk_partition.device,
-                        'mountpoint': disk_partition.mountpoint,
-                        'fstype': disk_partition.fstype,
-                        'total_gb': usage.total / (1024**3),
-                        'free_gb': usage.free / (1024**3),
-                        'used_percent': (usage.used / usage.total) * 100
-                    })
-                except (PermissionError, OSError):
-                    continue
+            disks_info = [
+                {
+                    'device': disk['device'],
+                    'mountpoint': disk['mountpoint'],
+                    'fstype': disk['fstype'],
+                    'total_gb': disk['total'] / (1024**3),
+                    'free_gb': disk['free'] / (1024**3),
+                    'used_percent': disk['used_percent']
+                }
+                for disk in self._collect_disk_snapshot()
+            ]
             
             # Try to get SMART data (macOS specific)
             smart_data = self._get_smart_data()
@@ -205,47 +376,111 @@ class SystemHealthChecker:
                 duration_ms=(time.time() - start_time) * 1000
             )
     
+    def _collect_disk_snapshot(self) -> List[Dict[str, Any]]:
+        """
+        Enumerate mounted partitions and their usage in a single pass.
+        
+        The scan is shared for ``_DISK_SNAPSHOT_TTL_SECONDS`` so the disk
+        health and disk space checks don't both stat every mountpoint.
+        Partitions that can't be queried are left out.
+        
+        Returns:
+            One dict per partition with device, mountpoint, fstype, byte
+            counts and ``used_percent``; treat as read-only
+        """
+        with self._disk_snapshot_lock:
+            cached = self._disk_snapshot
+            if cached and time.monotonic() - cached[0] < _DISK_SNAPSHOT_TTL_SECONDS:
+                return cached[1]
+            
+            disks = []
+            for partition in psutil.disk_partitions():
+                try:
+                    usage = psutil.disk_usage(partition.mountpoint)
+                except (PermissionError, OSError):
+                    continue
+                disks.append({
+                    'device': partition.device,
+                    'mountpoint': partition.mountpoint,
+                    'fstype': partition.fstype,
+                    'total': usage.total,
+                    'used': usage.used,
+                    'free': usage.free,
+                    'used_percent': (usage.used / usage.total) * 100
+                })
+            
+            self._disk_snapshot = (time.monotonic(), disks)
+            return disks
+    
+    def _wait_for_sample_interval(self, last_sample: Optional[Tuple[float, Any]]):
+        """Sleep until the previous sample is at least one sample interval old."""
+        if last_sample is not None:
+            remaining = _SAMPLE_INTERVAL_SECONDS - (time.monotonic() - last_sample[0])
+            if remaining > 0:
+                time.sleep(remaining)
+    
     def _get_smart_data(self) -> Optional[Dict[str, Any]]:
         """Attempt to get SMART data from disks (macOS/Unix specific)."""
         try:
             # Try using smartctl if available
-            if shutil.which('smartctl'):
+            smartctl_path = self._smartctl_path
+            if smartctl_path:
                 # Get list of devices
                 result = subprocess.run(
-                    ['smartctl', '--scan'],
+                    [smartctl_path, '--scan'],
                     capture_output=True,
                     text=True,
                     timeout=10
                 )
                 
                 if result.returncode == 0:
-                    devices = []
-                    for line in result.stdout.strip().split('\n'):
-                        if line.strip():
-                            device = line.split()[0]
-                            devices.append(device)
+                    # Each line starts with the device, e.g. "/dev/disk0 -d nvme # ..."
+                    devices = [line.split(None, 1)[0] for line in result.stdout.splitlines() if line.strip()]
                     
                     smart_info = {'devices': devices, 'health_status': {}, 'errors': []}
                     
-                    # Check health for each device
-                    for device in devices[:3]:  # Limit to first 3 devices
+                    # Query up to 3 devices side by side; each smartctl call
+                    # mostly waits on the drive, so they share one deadline
+                    processes = []
+                    for device in devices[:3]:
                         try:
-                            health_result = subprocess.run(
-                                ['smartctl', '-H', device],
-                                capture_output=True,
-                                text=True,
-                                timeout=5
-                            )
-                            
-                            if 'PASSED' in health_result.stdout:
-                                smart_info['health_status'][device] = 'PASSED'
-                            elif 'FAILED' in health_result.stdout:
-                                smart_info['health_status'][device] = 'FAILED'
-                                smart_info['errors'].append(f"SMART health check failed for {device}")
-                            
-                        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+                            processes.append((device, subprocess.Popen(
+                                [smartctl_path, '-H', '-j', device],
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL,
+                                text=True
+                            )))
+                        except (OSError, subprocess.SubprocessError):
                             continue
                     
+                    deadline = time.monotonic() + 5
+                    for device, process in processes:
+                        try:
+                            stdout, _ = process.communicate(timeout=max(deadline - time.monotonic(), 0))
+                        except subprocess.TimeoutExpired:
+                            process.kill()
+                            process.communicate()
+                            continue
+                        
+                        if _needs_text_retry(stdout, process.returncode):
+                            try:
+                                stdout = subprocess.run(
+                                    [smartctl_path, '-H', device],
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.DEVNULL,
+                                    text=True,
+                                    timeout=max(deadline - time.monotonic(), 1)
+                                ).stdout
+                            except (OSError, subprocess.SubprocessError):
+                                continue
+                        
+                        passed = _smart_health_passed(stdout)
+                        if passed is True:
+                            smart_info['health_status'][device] = 'PASSED'
+                        elif passed is False:
+                            smart_info['health_status'][device] = 'FAILED'
+                            smart_info['errors'].append(f"SMART health check failed for {device}")
+                    
                     return smart_info
             
             return None
@@ -312,8 +547,17 @@ class SystemHealthChecker:
         start_time = time.time()
         
         try:
-            # Get CPU usage over a short interval
-            cpu_percent = psutil.cpu_percent(interval=0.5)
+            # CPU usage since the previous check; only the first check has
+            # to block for a sampling interval
+            last_sample = self._last_cpu_sample
+            if last_sample is None:
+                cpu_percent = psutil.cpu_percent(interval=_SAMPLE_INTERVAL_SECONDS)
+                cpu_times = psutil.cpu_times()
+            else:
+                self._wait_for_sample_interval(last_sample)
+                cpu_times = psutil.cpu_times()
+                cpu_percent = _cpu_busy_percent(last_sample[1], cpu_times)
+            self._last_cpu_sample = (time.monotonic(), cpu_times)
             cpu_count = psutil.cpu_count()
             
             # Get load average (Unix systems)
@@ -377,35 +621,27 @@ class SystemHealthChecker:
         start_time = time.time()
         
         try:
-            partitions = psutil.disk_partitions()
             disk_info = []
             critical_disks = []
             warning_disks = []
             
-            for partition in partitions:
-                try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    used_percent = (usage.used / usage.total) * 100
-                    
-                    disk_data = {
-                        'device': partition.device,
-                        'mountpoint': partition.mountpoint,
-                        'fstype': partition.fstype,
-                        'total_gb': usage.total / (1024**3),
-                        'used_gb': usage.used / (1024**3),
-                        'free_gb': usage.free / (1024**3),
-                        'used_percent': used_percent
-                    }
-                    disk_info.append(disk_data)
-                    
-                    # Check thresholds
-                    if used_percent > self.thresholds['disk_space_critical_percent']:
-                        critical_disks.append(f"{partition.mountpoint}: {used_percent:.1f}% used")
-                    elif used_percent > self.thresholds['disk_space_warning_percent']:
-                        warning_disks.append(f"{partition.mountpoint}: {used_percent:.1f}% used")
-                        
-                except (PermissionError, OSError):
-                    continue
+            for disk in self._collect_disk_snapshot():
+                used_percent = disk['used_percent']
+                disk_info.append({
+                    'device': disk['device'],
+                    'mountpoint': disk['mountpoint'],
+                    'fstype': disk['fstype'],
+                    'total_gb': disk['total'] / (1024**3),
+                    'used_gb': disk['used'] / (1024**3),
+                    'free_gb': disk['free'] / (1024**3),
+                    'used_percent': used_percent
+                })
+                
+                # Check thresholds
+                if used_percent > self.thresholds['disk_space_critical_percent']:
+                    critical_disks.append(f"{disk['mountpoint']}: {used_percent:.1f}% used")
+                elif used_percent > self.thresholds['disk_space_warning_percent']:
+                    warning_disks.append(f"{disk['mountpoint']}: {used_percent:.1f}% used")
             
             # Determine overall status
             if critical_disks:
@@ -447,7 +683,7 @@ class SystemHealthChecker:
         
         try:
             # Check if FIO is available
-            fio_path = shutil.which('fio')
+            fio_path = self._fio_path
             
             if not fio_path:
                 return HealthCheckResult(
@@ -469,32 +705,17 @@ class SystemHealthChecker:
                 )
                 
                 if version_result.returncode == 0:
+                    # A successful --version already proves the binary runs
                     fio_version = version_result.stdout.strip()
                     
-                    # Try a simple FIO test to verify functionality
-                    test_result = subprocess.run(
-                        [fio_path, '--help'],
-                        capture_output=True,
-                        text=True,
-                        timeout=5
-                    )
-                    
-                    if test_result.returncode == 0:
-                        status = HealthStatus.HEALTHY
-                        message = f"FIO available and functional: {fio_version}"
-                    else:
-                        status = HealthStatus.WARNING
-                        message = f"FIO found but help command failed: {fio_version}"
-                    
                     return HealthCheckResult(
                         name="fio_dependency",
-                        status=status,
-                        message=message,
+                        status=HealthStatus.HEALTHY,
+                        message=f"FIO available and functional: {fio_version}",
                         details={
                             'fio_path': fio_path,
                             'fio_version': fio_version,
-                            'version_check_success': version_result.returncode == 0,
-                            'help_check_success': test_result.returncode == 0
+                            'version_check_success': True
                         },
                         timestamp=time.time(),
                         duration_ms=(time.time() - start_time) * 1000
@@ -629,21 +850,30 @@ class SystemHealthChecker:
         start_time = time.time()
         
         try:
-            # Get initial disk I/O counters
-            initial_io = psutil.disk_io_counters()
-            if not initial_io:
-                return HealthCheckResult(
-                    name="disk_io_performance",
-                    status=HealthStatus.UNKNOWN,
-                    message="Disk I/O counters not available",
-                    details={'io_counters_available': False},
-                    timestamp=time.time(),
-                    duration_ms=(time.time() - start_time) * 1000
-                )
+            # Diff against the previous check's counters; only the first
+            # check has to take its own baseline and wait
+            last_sample = self._last_io_sample
+            if last_sample is None:
+                initial_io = psutil.disk_io_counters()
+                if not initial_io:
+                    return HealthCheckResult(
+                        name="disk_io_performance",
+                        status=HealthStatus.UNKNOWN,
+                        message="Disk I/O counters not available",
+                        details={'io_counters_available': False},
+                        timestamp=time.time(),
+                        duration_ms=(time.time() - start_time) * 1000
+                    )
+                initial_t = time.monotonic()
+                time.sleep(_SAMPLE_INTERVAL_SECONDS)
+            else:
+                initial_t, initial_io = last_sample
+                self._wait_for_sample_interval(last_sample)
             
-            # Wait a short time and measure again
-            time.sleep(0.5)
             final_io = psutil.disk_io_counters()
+            final_t = time.monotonic()
+            self._last_io_sample = (final_t, final_io)
+            interval = max(final_t - initial_t, 1e-3)
             
             # Calculate I/O metrics
             read_bytes_diff = final_io.read_bytes - initial_io.read_bytes
@@ -655,7 +885,7 @@ class SystemHealthChecker:
             total_io_ops = read_count_diff + write_count_diff
             if total_io_ops > 0:
                 # This is a rough approximation
-                avg_latency_ms = (0.5 * 1000) / total_io_ops  # Very rough estimate
+                avg_latency_ms = (interval * 1000) / total_io_ops  # Very rough estimate
             else:
                 avg_latency_ms = 0
             
@@ -675,11 +905,11 @@ class SystemHealthChecker:
                 status=status,
                 message=message,
                 details={
-                    'measurement_interval_seconds': 0.5,
-                    'read_bytes_per_second': read_bytes_diff * 2,
-                    'write_bytes_per_second': write_bytes_diff * 2,
-                    'read_ops_per_second': read_count_diff * 2,
-                    'write_ops_per_second': write_count_diff * 2,
+                    'measurement_interval_seconds': interval,
+                    'read_bytes_per_second': read_bytes_diff / interval,
+                    'write_bytes_per_second': write_bytes_diff / interval,
+                    'read_ops_per_second': read_count_diff / interval,
+                    'write_ops_per_second': write_count_diff / interval,
                     'estimated_avg_latency_ms': avg_latency_ms,
                     'total_io_ops': total_io_ops
                 },
@@ -845,13 +1075,15 @@ class SystemHealthChecker:
         if results is None:
             results = self.run_all_checks()
         
+        counts = Counter(r.status for r in results)
         summary = {
             'timestamp': time.time(),
             'total_checks': len(results),
-            'healthy': sum(1 for r in results if r.status == HealthStatus.HEALTHY),
-            'warnings': sum(1 for r in results if r.status == HealthStatus.WARNING),
-            'critical': sum(1 for r in results if r.status == HealthStatus.CRITICAL),
-            'unknown': sum(1 for r in results if r.status == HealthStatus.UNKNOWN),
+            'healthy': counts[HealthStatus.HEALTHY],
+            'warnings': counts[HealthStatus.WARNING],
+            'critical': counts[HealthStatus.CRITICAL],
+            'unknown': counts[HealthStatus.UNKNOWN],
+            'skipped': counts[HealthStatus.SKIPPED],
             'overall_status': self._determine_overall_status(results),
             'details': [asdict(result) for result in results]
         }
@@ -859,12 +1091,13 @@ class SystemHealthChecker:
         return summary
     
     def _determine_overall_status(self, results: List[HealthCheckResult]) -> str:
-        """Determine overall system health status."""
-        if any(r.status == HealthStatus.CRITICAL for r in results):
+        """Determine overall system health status; skipped checks do not count."""
+        statuses = {r.status for r in results} - {HealthStatus.SKIPPED}
+        if HealthStatus.CRITICAL in statuses:
             return "critical"
-        elif any(r.status == HealthStatus.WARNING for r in results):
+        elif HealthStatus.WARNING in statuses:
             return "warning"
-        elif all(r.status == HealthStatus.HEALTHY for r in results):
+        elif statuses <= {HealthStatus.HEALTHY}:
             return "healthy"
         else:
             return "unknown"
@@ -9,9 +9,10 @@ import json
 import time
 import psutil
 import os
+from collections import defaultdict
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Set, Tuple
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 
@@ -66,6 +67,10 @@ class PerformanceMonitor:
         self.log_dir.mkdir(exist_ok=True)
         
         self.metrics = {}
+        # Metric names indexed by operation name and test_id tag, so callers
+        # can find a test's metrics without scanning every metric name
+        self._by_op: Dict[str, Set[str]] = defaultdict(set)
+        self._by_test: Dict[str, Set[str]] = defaultdict(set)
         self.start_time = time.time()
         
         # Setup structured logging
@@ -123,16 +128,33 @@ class PerformanceMonitor:
             tags: Optional tags for categorization
             unit: Optional unit (e.g., 'seconds', 'bytes', 'iops')
         """
+        self._record_metric(logging.getLogger('diskbench.metrics'), name, value,
+                            tags, unit, time.time())
+    
+    def log_metrics_batch(self, entries: List[Tuple[str, float, Optional[Dict[str, Any]], Optional[str]]]):
+        """
+        Log several performance metrics in one call.
+        
+        Args:
+            entries: (name, value, tags, unit) tuples, as for log_metric
+        """
+        logger = logging.getLogger('diskbench.metrics')
+        event_ts = time.time()
+        for name, value, tags, unit in entries:
+            self._record_metric(logger, name, value, tags, unit, event_ts)
+    
+    def _record_metric(self, logger: logging.Logger, name: str, value: float,
+                       tags: Optional[Dict[str, Any]], unit: Optional[str], event_ts: float):
+        """Log a single metric and store it for aggregation."""
         metric_data = {
             'metric': name,
             'value': value,
-            'event_ts': time.time(),
+            'event_ts': event_ts,
             'tags': tags or {},
             'unit': unit
         }
         
         # Log to structured logger
-        logger = logging.getLogger('diskbench.metrics')
         logger.info(
             f"Metric: {name}",
             extra={
@@ -145,6 +167,8 @@ class PerformanceMonitor:
         if name not in self.metrics:
             self.metrics[name] = []
         self.metrics[name].append(metric_data)
+        if tags and 'test_id' in tags:
+            self._by_test[tags['test_id']].add(name)
         
         # Limit stored metrics to prevent memory issues
         if len(self.metrics[name]) > 1000:
@@ -227,6 +251,8 @@ class PerformanceMonitor:
         """
         start_time = time.time()
         start_metrics = self.get_system_metrics()
+        metric_name = f'{operation_name}_duration_seconds'
+        self._by_op[operation_name].add(metric_name)
         
         logger = logging.getLogger(f'diskbench.operations')
         logger.info(
@@ -267,7 +293,7 @@ class PerformanceMonitor:
             
             # Log failure metric
             self.log_metric(
-                f'{operation_name}_duration_seconds',
+                metric_name,
                 duration,
                 tags={**(tags or {}), 'status': 'failure'},
                 unit='seconds'
@@ -296,7 +322,7 @@ class PerformanceMonitor:
                 
                 # Log success metric
                 self.log_metric(
-                    f'{operation_name}_duration_seconds',
+                    metric_name,
                     duration,
                     tags={**(tags or {}), 'status': 'success'},
                     unit='seconds'
@@ -342,12 +368,40 @@ class PerformanceMonitor:
         except Exception as e:
             return {'error': f'Failed to calculate metrics delta: {e}'}
     
-    def get_metric_summary(self, metric_name: str) -> Dict[str, Any]:
-        """Get statistical summary of a collected metric."""
+    def related_metrics(self, test_id: Optional[str] = None,
+                        operation_name: Optional[str] = None) -> List[str]:
+        """
+        Get names of metrics recorded for a test or operation.
+        
+        Args:
+            test_id: Test ID the metrics were tagged with
+            operation_name: Operation measured via measure_operation
+        
+        Returns:
+            Sorted list of matching metric names
+        """
+        names = set()
+        if test_id is not None:
+            names |= self._by_test.get(test_id, set())
+        if operation_name is not None:
+            names |= self._by_op.get(operation_name, set())
+        return sorted(names)
+    
+    def get_metric_summary(self, metric_name: str, test_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get statistical summary of a collected metric.
+        
+        Args:
+            metric_name: Metric to summarize
+            test_id: Only summarize values tagged with this test ID
+        """
         if metric_name not in self.metrics:
             return {'error': f'Metric {metric_name} not found'}
         
-        values = [m['value'] for m in self.metrics[metric_name]]
+        entries = self.metrics[metric_name]
+        if test_id is not None:
+            entries = [m for m in entries if m['tags'].get('test_id') == test_id]
+        values = [m['value'] for m in entries]
         
         if not values:
             return {'error': 'No values for metric'}
@@ -358,7 +412,7 @@ class PerformanceMonitor:
             'max': max(values),
             'avg': sum(values) / len(values),
             'latest': values[-1] if values else None,
-            'unit': self.metrics[metric_name][-1].get('unit') if self.metrics[metric_name] else None
+            'unit': entries[-1].get('unit') if entries else None
         }
     
     def export_metrics(self, output_file: Optional[str] = None) -> str:
@@ -382,8 +436,27 @@ class PerformanceMonitor:
         
         return output_file
     
+    def export_metrics_jsonl(self, output_file: Optional[str] = None) -> str:
+        """
+        Stream collected metrics to a JSON-lines file, one metric per line.
+        
+        Unlike export_metrics this never builds the whole export in memory,
+        which keeps large metric stores cheap to dump.
+        """
+        if output_file is None:
+            output_file = str(self.log_dir / f"metrics_export_{int(time.time())}.jsonl")
+        
+        with open(output_file, 'w', buffering=1 << 20) as f:
+            for name, values in self.metrics.items():
+                f.write(json.dumps({'name': name, 'values': values}, default=str))
+                f.write('\n')
+        
+        return output_file
+    
     def clear_metrics(self):
         """Clear collected metrics to free memory."""
         cleared_count = sum(len(metrics) for metrics in self.metrics.values())
         self.metrics.clear()
+        self._by_op.clear()
+        self._by_test.clear()
         self.logger.info(f"Cleared {cleared_count} collected metrics")
@@ -95,7 +95,8 @@ def demonstrate_health_checks():
                 HealthStatus.HEALTHY: "✅",
                 HealthStatus.WARNING: "⚠️",
                 HealthStatus.CRITICAL: "❌",
-                HealthStatus.UNKNOWN: "❓"
+                HealthStatus.UNKNOWN: "❓",
+                HealthStatus.SKIPPED: "⏭️"
             }[result.status]
             
             print(f"   {status_icon} {check_name}: {result.status.value} - {result.message}")
@@ -167,6 +167,18 @@ Examples:
         help='Estimated duration of the test in seconds (for progress reporting)'
     )
 
+    parser.add_argument(
+        '--no-io-uring',
+        action='store_true',
+        help='Keep the configured posixaio/libaio engine instead of switching to io_uring on Linux'
+    )
+
+    parser.add_argument(
+        '--isolate-cpus',
+        action='store_true',
+        help='Keep FIO off the first CPU so diskbench does not compete with it (Linux)'
+    )
+
     # Output format options
     parser.add_argument(
         '--json',
@@ -283,8 +295,7 @@ def main() -> int:
 
             if args.check_fio:
                 from diskbench.core.fio_runner import FioRunner
-                fio_runner = FioRunner()
-                version_info['fio_status'] = fio_runner.get_fio_status()
+                version_info['fio_status'] = FioRunner.shared().get_fio_status()
 
             if args.json:
                 print(json.dumps(version_info, indent=2))
@@ -387,7 +398,8 @@ def main() -> int:
         # Handle test commands
         if args.test or args.custom_config:
             global current_test_command
-            test_cmd = DiskTestCommand()
+            test_cmd = DiskTestCommand(prefer_io_uring=not args.no_io_uring,
+                                       isolate_cpus=args.isolate_cpus)
             current_test_command = test_cmd  # Store for signal handling
 
             # Prepare test parameters
@@ -3,11 +3,13 @@ Unit tests for EnhancedFioRunner with monitoring integration.
 """
 import pytest
 import tempfile
+import threading
 import time
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 
 from diskbench.core.enhanced_fio_runner import EnhancedFioRunner
+from diskbench.core.monitoring import PerformanceMonitor
 from diskbench.core.health_checks import HealthStatus, HealthCheckResult
 
 
@@ -114,6 +116,22 @@ class TestEnhancedFioRunner:
         runner.health_checker.check_memory_usage.assert_called_once()
         runner.health_checker.check_cpu_usage.assert_called_once()
     
+    @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
+    @patch('diskbench.core.enhanced_fio_runner.FioRunner.run_fio_test')
+    def test_run_fio_test_enhanced_forwards_runner_options(self, mock_run_fio_test, mock_init, mock_fio_result):
+        """Test that io_uring and CPU isolation options reach the base runner."""
+        mock_init.return_value = None
+        mock_run_fio_test.return_value = mock_fio_result
+        
+        runner = EnhancedFioRunner(enable_monitoring=False, enable_health_checks=False,
+                                   prefer_io_uring=False, isolate_cpus=True)
+        mock_init.assert_called_once_with(False, True)
+        
+        runner.run_fio_test_enhanced("[job]\nrw=read\n", "/tmp/test", 30,
+                                     prefer_io_uring=True, isolate_cpus=False)
+        
+        assert mock_run_fio_test.call_args.kwargs == {'prefer_io_uring': True, 'isolate_cpus': False}
+    
     @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
     def test_run_fio_test_enhanced_health_check_failure(self, mock_init):
         """Test enhanced FIO test with critical health check failure."""
@@ -151,6 +169,14 @@ class TestEnhancedFioRunner:
         assert result['error'] == 'Pre-test health checks failed'
         assert 'critical_issues' in result
         assert len(result['critical_issues']) > 0
+        critical_payloads = [h for h in result['health_results'] if h['status'] == 'critical']
+        assert critical_payloads[0] == {
+            'name': 'fio_dependency',
+            'status': 'critical',
+            'message': 'FIO not found',
+            'timestamp': critical_health_result.timestamp,
+            'duration_ms': 5.0
+        }
     
     @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
     def test_extract_test_tags(self, mock_init):
@@ -182,6 +208,21 @@ directory=/tmp/test
         assert tags['io_depth'] == '32'
         assert 'config_size_bytes' in tags
     
+    @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
+    def test_extract_test_tags_cached_per_config(self, mock_init):
+        """Test that repeated configs reuse the parse but return fresh dicts."""
+        mock_init.return_value = None
+        runner = EnhancedFioRunner(enable_monitoring=False, enable_health_checks=False)
+        EnhancedFioRunner._parse_config_tags.cache_clear()
+        
+        first = runner._extract_test_tags("rw=write\nbs=1M\n", "/tmp/a")
+        first['test_id'] = 'abc'
+        second = runner._extract_test_tags("rw=write\nbs=1M\n", "/tmp/a")
+        
+        assert 'test_id' not in second
+        assert second['block_size'] == '1M'
+        assert EnhancedFioRunner._parse_config_tags.cache_info().hits == 1
+    
     @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
     def test_log_test_performance_metrics(self, mock_init, mock_fio_result):
         """Test logging of performance metrics from FIO results."""
@@ -194,12 +235,12 @@ directory=/tmp/test
         tags = {'test_id': 'test123', 'rw_pattern': 'read'}
         runner._log_test_performance_metrics(mock_fio_result, tags)
         
-        # Verify metrics were logged
-        assert runner.monitor.log_metric.called
+        # Verify metrics were logged in a single batch
+        runner.monitor.log_metrics_batch.assert_called_once()
         
         # Check some specific metrics were logged
-        call_args_list = runner.monitor.log_metric.call_args_list
-        metric_names = [call.args[0] for call in call_args_list]
+        batch = runner.monitor.log_metrics_batch.call_args.args[0]
+        metric_names = [entry[0] for entry in batch]
         
         assert 'fio_read_bandwidth_kbs' in metric_names
         assert 'fio_write_bandwidth_kbs' in metric_names
@@ -226,6 +267,7 @@ directory=/tmp/test
             'test123_duration_seconds': [{'value': 30.5}],
             'fio_read_bandwidth_kbs': [{'value': 1024.0}]
         }
+        runner.monitor.related_metrics.return_value = ['test123_duration_seconds']
         runner.monitor.get_metric_summary.return_value = {
             'count': 1,
             'avg': 30.5,
@@ -246,6 +288,51 @@ directory=/tmp/test
         assert monitoring_data['monitoring_enabled'] is True
         assert 'system_metrics' in monitoring_data
         assert 'metrics_collected' in monitoring_data
+        assert 'test123_duration_seconds_summary' in monitoring_data
+        assert 'fio_read_bandwidth_kbs_summary' not in monitoring_data
+        runner.monitor.related_metrics.assert_called_once_with('test123', 'fio_test_test123')
+    
+    @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
+    def test_enhance_results_keeps_tests_apart(self, mock_init, mock_fio_result):
+        """Test that summaries only include the enhanced test's own values."""
+        mock_init.return_value = None
+        runner = EnhancedFioRunner(enable_monitoring=True)
+        
+        with tempfile.TemporaryDirectory() as log_dir:
+            runner.monitor = PerformanceMonitor(log_dir=log_dir)
+            with runner.monitor.measure_operation('fio_test_aaa', tags={'test_id': 'aaa'}):
+                pass
+            runner.monitor.log_metric('fio_read_iops', 100.0, tags={'test_id': 'aaa'}, unit='iops')
+            with runner.monitor.measure_operation('fio_test_bbb', tags={'test_id': 'bbb'}):
+                pass
+            runner.monitor.log_metric('fio_read_iops', 900.0, tags={'test_id': 'bbb'}, unit='iops')
+            runner.monitor.log_metric('fio_read_iops', 700.0, tags={'test_id': 'bbb'}, unit='iops')
+            
+            monitoring_data = runner._enhance_results_with_monitoring(
+                dict(mock_fio_result), 'bbb', 'fio_test_bbb'
+            )['monitoring']
+        
+        summary = monitoring_data['fio_read_iops_summary']
+        assert summary['count'] == 2
+        assert summary['min'] == 700.0
+        assert summary['max'] == 900.0
+        assert 'fio_test_bbb_duration_seconds_summary' in monitoring_data
+        assert 'fio_test_aaa_duration_seconds_summary' not in monitoring_data
+    
+    @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
+    def test_enhance_results_skips_error_results(self, mock_init):
+        """Test that failed results are returned without monitoring data."""
+        mock_init.return_value = None
+        runner = EnhancedFioRunner(enable_monitoring=True)
+        runner.monitor = Mock()
+        
+        error_result = {'error': 'FIO failed'}
+        enhanced_result = runner._enhance_results_with_monitoring(
+            error_result, 'test123', 'fio_test_test123'
+        )
+        
+        assert enhanced_result == {'error': 'FIO failed'}
+        runner.monitor.get_system_metrics.assert_not_called()
     
     @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
     def test_perform_pre_test_health_checks(self, mock_init):
@@ -286,6 +373,42 @@ directory=/tmp/test
         assert 'pre_test_health_checks_warnings' in metric_names
         assert 'pre_test_health_checks_critical' in metric_names
     
+    @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
+    def test_pre_test_health_checks_stop_on_critical(self, mock_init):
+        """Test that checks still pending after a critical failure are skipped."""
+        mock_init.return_value = None
+        runner = EnhancedFioRunner(enable_monitoring=True, enable_health_checks=True)
+        
+        critical_result = HealthCheckResult(
+            name="fio_dependency",
+            status=HealthStatus.CRITICAL,
+            message="FIO not found",
+            details={},
+            timestamp=time.time(),
+            duration_ms=1.0
+        )
+        release = threading.Event()
+        
+        def slow_check():
+            release.wait(5)
+            return critical_result
+        
+        runner.health_checker.check_fio_dependency = Mock(return_value=critical_result)
+        runner.health_checker.check_disk_space = slow_check
+        runner.health_checker.check_memory_usage = slow_check
+        runner.health_checker.check_cpu_usage = slow_check
+        runner.monitor = Mock()
+        
+        try:
+            results = runner._perform_pre_test_health_checks('test123')
+        finally:
+            release.set()
+        
+        assert len(results) == 4
+        assert results[0].status == HealthStatus.CRITICAL
+        assert [r.status for r in results[1:]] == [HealthStatus.SKIPPED] * 3
+        assert results[1].name == 'slow_check'
+    
     @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
     def test_get_monitoring_status(self, mock_init):
         """Test getting monitoring system status."""
@@ -319,6 +442,48 @@ directory=/tmp/test
         assert 'health_summary' in status
         assert status['health_summary']['overall_status'] == 'healthy'
     
+    @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
+    def test_get_monitoring_status_reuses_health_snapshot(self, mock_init):
+        """Test that status polling serves cached health and refreshes in background."""
+        mock_init.return_value = None
+        runner = EnhancedFioRunner(enable_monitoring=False, enable_health_checks=True)
+        runner.fio_path = None
+        
+        runner.health_checker = Mock()
+        runner.health_checker.run_all_checks.return_value = []
+        runner.health_checker.get_health_summary.return_value = {
+            'overall_status': 'healthy',
+            'healthy': 1,
+            'warnings': 0,
+            'critical': 0,
+            'timestamp': time.time()
+        }
+        
+        runner.get_monitoring_status()
+        status = runner.get_monitoring_status()
+        
+        assert status['health_summary']['overall_status'] == 'healthy'
+        assert runner.health_checker.run_all_checks.call_count == 1
+        
+        # Expire the snapshot: the stale value is returned while a refresh runs
+        runner._health_snapshot_ts -= 60
+        runner.health_checker.get_health_summary.return_value = {
+            'overall_status': 'warning',
+            'healthy': 0,
+            'warnings': 1,
+            'critical': 0,
+            'timestamp': time.time()
+        }
+        status = runner.get_monitoring_status()
+        assert status['health_summary']['overall_status'] == 'healthy'
+        
+        # Wait for the background refresh to finish
+        with runner._health_refresh_lock:
+            pass
+        
+        status = runner.get_monitoring_status()
+        assert status['health_summary']['overall_status'] == 'warning'
+    
     @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
     def test_export_monitoring_data(self, mock_init):
         """Test exporting monitoring data."""
@@ -334,6 +499,21 @@ directory=/tmp/test
         assert export_path == '/tmp/export.json'
         runner.monitor.export_metrics.assert_called_once_with(None)
     
+    @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
+    def test_export_monitoring_data_jsonl(self, mock_init):
+        """Test that a .jsonl target dispatches to the streaming exporter."""
+        mock_init.return_value = None
+        runner = EnhancedFioRunner(enable_monitoring=True)
+        
+        runner.monitor = Mock()
+        runner.monitor.export_metrics_jsonl.return_value = '/tmp/export.jsonl'
+        
+        export_path = runner.export_monitoring_data('/tmp/export.jsonl')
+        
+        assert export_path == '/tmp/export.jsonl'
+        runner.monitor.export_metrics_jsonl.assert_called_once_with('/tmp/export.jsonl')
+        runner.monitor.export_metrics.assert_not_called()
+    
     @patch('diskbench.core.enhanced_fio_runner.FioRunner.__init__')
     def test_export_monitoring_data_disabled(self, mock_init):
         """Test exporting monitoring data when monitoring is disabled."""
@@ -183,6 +183,20 @@ class TestPerformanceMonitor:
         assert metric_data['unit'] == 'seconds'
         assert 'event_ts' in metric_data
     
+    def test_log_metrics_batch(self, temp_log_dir):
+        """Test logging several metrics in one call."""
+        monitor = PerformanceMonitor(log_dir=temp_log_dir)
+        
+        monitor.log_metrics_batch([
+            ('read_iops', 100.0, {'test_id': 'abc'}, 'iops'),
+            ('read_iops', 120.0, {'test_id': 'abc'}, 'iops'),
+            ('write_iops', 80.0, None, None),
+        ])
+        
+        assert [m['value'] for m in monitor.metrics['read_iops']] == [100.0, 120.0]
+        assert monitor.metrics['write_iops'][0]['tags'] == {}
+        assert monitor.related_metrics('abc') == ['read_iops']
+    
     def test_measure_operation_success(self, temp_log_dir):
         """Test successful operation measurement."""
         monitor = PerformanceMonitor(log_dir=temp_log_dir)
@@ -211,6 +225,25 @@ class TestPerformanceMonitor:
         metric = monitor.metrics[metric_name][0]
         assert metric['tags']['status'] == 'failure'
     
+    def test_related_metrics_index(self, temp_log_dir):
+        """Test lookup of metrics by test ID and operation name."""
+        monitor = PerformanceMonitor(log_dir=temp_log_dir)
+        
+        with monitor.measure_operation('fio_test_abc', tags={'test_id': 'abc'}):
+            pass
+        monitor.log_metric('fio_read_iops', 100.0, tags={'test_id': 'abc'})
+        monitor.log_metric('fio_write_iops', 50.0, tags={'test_id': 'xyz'})
+        
+        assert monitor.related_metrics('abc', 'fio_test_abc') == [
+            'fio_read_iops', 'fio_test_abc_duration_seconds'
+        ]
+        assert monitor.related_metrics(operation_name='fio_test_abc') == [
+            'fio_test_abc_duration_seconds'
+        ]
+        
+        monitor.clear_metrics()
+        assert monitor.related_metrics('abc', 'fio_test_abc') == []
+    
     def test_get_metric_summary(self, temp_log_dir):
         """Test metric summary calculation."""
         monitor = PerformanceMonitor(log_dir=temp_log_dir)
@@ -258,6 +291,23 @@ class TestPerformanceMonitor:
         assert 'test_metric1' in data['collected_metrics']
         assert 'test_metric2' in data['collected_metrics']
     
+    def test_export_metrics_jsonl(self, temp_log_dir):
+        """Test streaming metrics export to JSON lines."""
+        monitor = PerformanceMonitor(log_dir=temp_log_dir)
+        
+        monitor.log_metric('test_metric1', 10.0, unit='seconds')
+        monitor.log_metric('test_metric1', 11.0, unit='seconds')
+        monitor.log_metric('test_metric2', 20.0, unit='bytes')
+        
+        export_file = monitor.export_metrics_jsonl()
+        
+        assert export_file.endswith('.jsonl')
+        with open(export_file, 'r') as f:
+            lines = [json.loads(line) for line in f]
+        
+        assert [line['name'] for line in lines] == ['test_metric1', 'test_metric2']
+        assert [m['value'] for m in lines[0]['values']] == [10.0, 11.0]
+    
     def test_clear_metrics(self, temp_log_dir):
         """Test metrics clearing."""
         monitor = PerformanceMonitor(log_dir=temp_log_dir)
@@ -2,10 +2,12 @@
 System information utilities for diskbench helper binary.
 """
 
+import functools
 import os
 import platform
 import subprocess
 import json
+import time
 from typing import Dict, Any
 
 
@@ -65,6 +67,25 @@ def get_system_info() -> Dict[str, Any]:
     return info
 
 
+@functools.lru_cache(maxsize=1)
+def _system_info_snapshot() -> Dict[str, Any]:
+    return get_system_info()
+
+
+def get_cached_system_info() -> Dict[str, Any]:
+    """
+    Get system information, gathered once per process.
+
+    System info does not change while the process runs, but collecting it spawns
+    sw_vers/system_profiler on macOS. Callers that embed it in every result should
+    use this instead of get_system_info().
+
+    Returns:
+        Dict containing system information (a fresh shallow copy per call)
+    """
+    return dict(_system_info_snapshot())
+
+
 def _parse_size_fallback(size_str: str) -> int:
     """
     Parse size string from df -h to bytes.
@@ -300,6 +321,11 @@ def check_admin_privileges() -> bool:
     return os.geteuid() == 0
 
 
+def local_timestamp() -> str:
+    """Current local time as ISO 8601 with second precision, as the GUI displays it."""
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime())
+
+
 def get_environment_info() -> Dict[str, Any]:
     """
     Get relevant environment information.
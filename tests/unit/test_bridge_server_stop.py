@@ -16,6 +16,8 @@ class DummyProcess:
         self.pid = pid
     def poll(self):
         return None
+    def wait(self, timeout=None):
+        raise bridge.subprocess.TimeoutExpired('diskbench', timeout)
 
 
 def test_stop_test_kills_tracked_process_and_updates_state(monkeypatch):
@@ -110,3 +110,30 @@ def test_custom_success_placeholders_injected(cmd, monkeypatch):
     finally:
         os.unlink(temp_path)
 
+
+def test_custom_without_system_info(cmd, monkeypatch):
+    import commands.test as cmd_mod
+    monkeypatch.setattr(cmd_mod, "validate_disk_path", lambda p: True)
+    monkeypatch.setattr(cmd_mod, "check_available_space", lambda p, gb: True)
+
+    def fail_system_info():
+        raise AssertionError("system info should not be gathered")
+    monkeypatch.setattr(cmd_mod, "get_cached_system_info", fail_system_info)
+
+    with tempfile.NamedTemporaryFile(mode='w', delete=False) as tf:
+        tf.write("[job]\nfilename=/tmp/plain.bin\nsize=1G\n")
+        temp_path = tf.name
+
+    try:
+        res = cmd.execute_custom_test(
+            disk_path="/Volumes/Target",
+            config_file=temp_path,
+            test_size_gb=1,
+            output_file="/tmp/out.json",
+            include_system_info=False
+        )
+        assert res is not None
+        assert res['system_info'] is None
+        assert cmd._calls['cfg'] == "[job]\nfilename=/tmp/plain.bin\nsize=1G\n"
+    finally:
+        os.unlink(temp_path)
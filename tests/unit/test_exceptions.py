@@ -1,3 +1,5 @@
+import copy
+import pickle
 import sys
 from pathlib import Path
 import pytest
@@ -59,3 +61,34 @@ def test_json_parsing_error():
     assert err.context['line_no'] == 42
     assert err.context['column_no'] == 10
     assert err.context['content_preview'] == "{'invalid'"
+
+
+def test_exception_attributes_use_slots():
+    err = FIOExecutionError("FIO failed", return_code=1)
+    assert err.__dict__ == {}
+    assert err.context['return_code'] == 1
+
+
+def test_fio_execution_error_to_dict_keeps_output_tail():
+    stderr = "x" * 1000 + "fio: io_u error on file /tmp/test"
+    err = FIOExecutionError("FIO failed", return_code=1, stdout=b"a" * 600, stderr=stderr)
+    assert err.context['stderr'] is stderr
+    context = err.to_dict()['context']
+    assert context['stderr'].endswith("io_u error on file /tmp/test")
+    assert len(context['stderr']) == 500
+    assert context['stdout'] == b"a" * 500
+
+
+def test_exceptions_survive_pickle_and_copy():
+    errors = [
+        FIOExecutionError('boom', return_code=3, stderr='bad'),
+        DiskNotAvailableError('/Volumes/X', 'not mounted'),
+        InsufficientSpaceError(10.0, 2.5, '/Volumes/X'),
+    ]
+    for err in errors:
+        for clone in (pickle.loads(pickle.dumps(err)), copy.copy(err), copy.deepcopy(err)):
+            assert type(clone) is type(err)
+            assert str(clone) == str(err)
+            assert clone.context == err.context
+            assert clone.recovery_hint == err.recovery_hint
+            assert clone.timestamp == err.timestamp
@@ -1,9 +1,10 @@
 import json
+import os
 from types import SimpleNamespace
 
 import pytest
 
-from diskbench.core.fio_runner import FioRunner, FIOExecutionError
+from diskbench.core.fio_runner import FioRunner, FIOExecutionError, process_fio_results
 
 
 @pytest.fixture
@@ -12,6 +13,18 @@ def runner(monkeypatch):
     return FioRunner()
 
 
+@pytest.fixture
+def fake_fio(monkeypatch, tmp_path):
+    """Return a factory installing a shell script body as the FIO binary."""
+    def install(script):
+        path = tmp_path / 'fio'
+        path.write_text("#!/bin/sh\n" + script)
+        path.chmod(0o755)
+        monkeypatch.setattr(FioRunner, "_find_fio_binary", lambda self: str(path))
+        return path
+    return install
+
+
 def test_extract_io_stats_prefers_bw_bytes(runner):
     stats = runner._extract_io_stats({'bw_bytes': 2048, 'iops_mean': 5})
     assert stats['bw'] == 2
@@ -59,6 +72,50 @@ def test_process_fio_results_wraps_jobs_and_summary(runner):
     assert result['engine'] == 'homebrew_fio'
 
 
+def test_shared_returns_one_runner(runner, monkeypatch):
+    monkeypatch.setattr(FioRunner, '_shared', None)
+    shared = FioRunner.shared()
+    assert shared is FioRunner.shared()
+    assert shared is not runner
+
+
+def test_shared_is_kept_per_class(monkeypatch):
+    class SubRunner(FioRunner):
+        pass
+
+    monkeypatch.setattr(FioRunner, '_shared', None)
+    base = FioRunner.shared()
+    sub = SubRunner.shared()
+
+    assert type(sub) is SubRunner
+    assert sub is SubRunner.shared()
+    assert FioRunner.shared() is base
+
+
+@pytest.mark.performance
+def test_process_fio_results_standalone_multi_job(runner):
+    fio_json = {
+        'fio version': 'fio-3.40',
+        'timestamp': 123,
+        'jobs': [{
+            'jobname': f'job{i}',
+            'read': {'iops': 10, 'bw': 100, 'lat_ns': {'mean': 1_000_000}},
+            'write': {'iops': 5, 'bw_bytes': 51200, 'lat_ns': {'mean': 3_000_000}},
+            'job_runtime': 1000 + i,
+        } for i in range(64)]
+    }
+
+    result = process_fio_results(fio_json, '/opt/vendor/fio')
+
+    assert len(result['jobs']) == 64
+    assert result['summary']['total_read_iops'] == 640
+    assert result['summary']['total_write_bw'] == 64 * 50
+    assert result['summary']['avg_write_latency'] == pytest.approx(3.0)
+    assert result['summary']['total_runtime'] == 1063
+    assert result['engine'] == 'vendor_fio'
+    assert runner._process_fio_results(fio_json) == dict(result, engine='homebrew_fio')
+
+
 def test_clean_json_output_filters_noise(runner):
     raw_output = """
 fio-3.40
@@ -74,6 +131,20 @@ Starting 1 job
     assert 'Starting' not in cleaned
 
 
+def test_clean_json_output_slices_bytes(runner):
+    raw_output = b'fio: warning\n{"jobs": [{"x": {}}]}\nRun status group 0\n'
+
+    assert runner._clean_json_output(raw_output) == b'{"jobs": [{"x": {}}]}'
+    assert runner._clean_json_output(b'no json here') == b''
+
+
+def test_clean_json_lines_keeps_json_lines_mentioning_fio(runner):
+    raw_output = 'Jobs: 1 (f=1)\n{\n  "fio version": "fio-3.40",\n  "jobs": []\n}\n'
+
+    cleaned = runner._clean_json_lines(raw_output)
+    assert json.loads(cleaned) == {'fio version': 'fio-3.40', 'jobs': []}
+
+
 def test_run_fio_test_without_binary_raises(monkeypatch, tmp_path):
     monkeypatch.setattr(FioRunner, "_find_fio_binary", lambda self: None)
     runner = FioRunner()
@@ -83,16 +154,313 @@ def test_run_fio_test_without_binary_raises(monkeypatch, tmp_path):
 
 
 def test_get_fio_status_success(monkeypatch, runner):
-    def fake_run(cmd, capture_output, text, timeout):
+    def fake_run(cmd, capture_output, timeout):
         assert cmd == ['/tmp/fio', '--version']
-        return SimpleNamespace(returncode=0, stdout='fio-3.40\n')
+        return SimpleNamespace(returncode=0, stdout=b'fio-3.40\n')
 
     monkeypatch.setattr('diskbench.core.fio_runner.subprocess.run', fake_run)
+    monkeypatch.setattr(FioRunner, '_fio_version_cache', {})
 
     status = runner.get_fio_status()
     assert status['available'] is True
     assert status['version'] == 'fio-3.40'
 
+    # The version is cached per binary path
+    monkeypatch.setattr('diskbench.core.fio_runner.subprocess.run', None)
+    assert runner.get_fio_status() == status
+
 
 def test_stop_fio_test_without_process_returns_false(runner):
     assert runner.stop_fio_test() is False
+
+
+def test_read_stream_tail_keeps_last_bytes():
+    import io
+    from diskbench.core import fio_runner
+
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"x" * 10000 + b"fio: error opening file")
+    os.close(write_fd)
+
+    tail = fio_runner._read_stream_tail(io.open(read_fd, 'rb'), 64)
+    assert len(tail) == 64
+    assert tail.endswith("fio: error opening file")
+
+
+def test_run_fio_test_pipes_config_and_reads_stdout(fake_fio, tmp_path):
+    seen = tmp_path / 'stdin_seen'
+    fake_fio(
+        f"cat > {seen}\n"
+        "printf '%s' '{\"fio version\": \"fio-3.40\", \"jobs\": [{\"jobname\": \"j\", \"read\": {\"iops\": 5}}]}'\n"
+    )
+    runner = FioRunner()
+
+    test_dir = tmp_path / 't'
+    result = runner.run_fio_test('[job]\nrw=read\n', str(test_dir), 0)
+
+    assert 'error' not in result
+    assert result['summary']['total_read_iops'] == 5
+    assert seen.read_text() == '[job]\nrw=read\n'
+    assert not test_dir.exists()
+
+
+def test_process_fio_results_stream_matches_legacy(runner):
+    pytest.importorskip('ijson')
+    fio_json = {
+        'fio version': 'fio-3.40',
+        'timestamp': 123,
+        'jobs': [
+            {'jobname': 'a', 'read': {'bw_bytes': 2048, 'iops': 10.5, 'lat_ns': {'mean': 1_000_000}},
+             'iodepth_level': {'1': 100.0}, 'job_runtime': 1000},
+            {'jobname': 'b', 'write': {'bw': 512, 'iops': 5, 'lat_ns': {'mean': 2_000_000}}},
+        ]
+    }
+
+    streamed = runner._process_fio_results_stream(json.dumps(fio_json).encode())
+    assert streamed == runner._process_fio_results(fio_json)
+
+
+def test_fio_command_validated_once_per_path(monkeypatch, runner):
+    calls = []
+
+    def fake_validate(cmd):
+        calls.append(cmd)
+        return list(cmd)
+
+    monkeypatch.setattr('diskbench.core.fio_runner.validate_fio_parameters', fake_validate)
+
+    assert runner._fio_command() == ['/tmp/fio', '--output-format=json', '-']
+    assert runner._fio_command() is runner._fio_command()
+    assert len(calls) == 1
+
+    runner.fio_path = '/opt/fio'
+    assert runner._fio_command()[0] == '/opt/fio'
+    assert len(calls) == 2
+
+
+def test_cleanup_test_directory_removes_flat_and_nested_layouts(runner, tmp_path):
+    flat = tmp_path / 'flat'
+    flat.mkdir()
+    (flat / 'job.0.0').write_bytes(b'x')
+    runner._cleanup_test_directory(str(flat))
+    assert not flat.exists()
+
+    nested = tmp_path / 'nested'
+    (nested / 'sub' / 'deeper').mkdir(parents=True)
+    (nested / 'sub' / 'job.0.0').write_bytes(b'x')
+    (nested / 'sub' / 'deeper' / 'job.0.1').write_bytes(b'x')
+    runner._cleanup_test_directory(str(nested))
+    assert not nested.exists()
+
+    # Nothing is left behind next to the test directories
+    assert list(tmp_path.iterdir()) == []
+    runner._cleanup_test_directory(str(tmp_path / 'missing'))
+
+
+def test_run_fio_test_async_pipes_config_and_reads_stdout(fake_fio, tmp_path):
+    import asyncio
+
+    fake_fio(
+        "cat > /dev/null\n"
+        "echo 'fio: warning' >&2\n"
+        "printf '%s' '{\"jobs\": [{\"jobname\": \"j\", \"write\": {\"iops\": 7}}]}'\n"
+    )
+    runner = FioRunner()
+
+    result = asyncio.run(runner.run_fio_test_async('[job]\n', str(tmp_path / 't'), 0))
+
+    assert result['summary']['total_write_iops'] == 7
+    assert runner.fio_process is None
+    assert not (tmp_path / 't').exists()
+
+
+def test_run_fio_test_async_without_binary_raises(monkeypatch, tmp_path):
+    import asyncio
+
+    monkeypatch.setattr(FioRunner, "_find_fio_binary", lambda self: None)
+    runner = FioRunner()
+
+    with pytest.raises(FIOExecutionError):
+        asyncio.run(runner.run_fio_test_async('[job]\n', str(tmp_path / 't'), 0))
+
+
+def test_run_fio_test_async_reports_progress(fake_fio, tmp_path):
+    import asyncio
+
+    fake_fio(
+        "cat > /dev/null\n"
+        "printf 'Jobs: 1 (f=1): [R(1)][25.0%%][eta 00m:03s]\\r\\n'\n"
+        "echo '{\"jobs\": [{\"jobname\": \"j\", \"read\": {\"iops\": 4}}]}'\n"
+    )
+    runner = FioRunner()
+    updates = []
+
+    result = asyncio.run(runner.run_fio_test_async(
+        '[job]\n', str(tmp_path / 't'), 0, updates.append, prefer_io_uring=False))
+
+    assert result['summary']['total_read_iops'] == 4
+    assert [(u['progress'], u['status']) for u in updates] == [(25.0, 'running'), (100.0, 'completed')]
+    assert updates[0]['eta_seconds'] == 3
+
+
+def test_run_fio_test_async_cancel_kills_fio_before_cleanup(fake_fio, monkeypatch, tmp_path):
+    import asyncio
+
+    fake_fio(
+        "cat > /dev/null\n"
+        f"echo $$ > {tmp_path / 'pid'}\n"
+        "sleep 30\n"
+    )
+    runner = FioRunner()
+    seen = {}
+
+    def cleanup(test_directory):
+        pid = int((tmp_path / 'pid').read_text())
+        try:
+            os.kill(pid, 0)
+            seen['alive'] = True
+        except ProcessLookupError:
+            seen['alive'] = False
+
+    monkeypatch.setattr(runner, '_cleanup_test_directory', cleanup)
+
+    async def main():
+        task = asyncio.ensure_future(runner.run_fio_test_async(
+            '[job]\n', str(tmp_path / 't'), 0, prefer_io_uring=False))
+        while not (tmp_path / 'pid').exists():
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    assert seen == {'alive': False}
+    assert runner.fio_process is None
+
+
+def test_fio_env_built_once(runner):
+    env = runner._fio_env()
+    assert env['FIO_DISABLE_SHM'] == '1'
+    assert '/opt/homebrew/bin' in env['PATH']
+    assert runner._fio_env() is env
+
+
+def test_ensure_test_directory_cached_until_cleanup(runner, tmp_path, monkeypatch):
+    test_dir = str(tmp_path / 't')
+    runner._ensure_test_directory(test_dir)
+    assert os.path.isdir(test_dir)
+
+    monkeypatch.setattr('diskbench.core.fio_runner.os.makedirs', None)
+    runner._ensure_test_directory(test_dir)
+
+    runner._cleanup_test_directory(test_dir)
+    assert test_dir not in runner._created_dirs
+
+
+def test_run_fio_test_ignores_trailing_output_with_braces(fake_fio, monkeypatch, tmp_path):
+    fake_fio(
+        "cat > /dev/null\n"
+        "echo 'Starting 1 process'\n"
+        "echo '{\"jobs\": [{\"jobname\": \"j\", \"read\": {\"iops\": 3}}]}'\n"
+        "echo 'Run status group 0 {all jobs}'\n"
+    )
+    runner = FioRunner()
+    monkeypatch.setattr(runner, '_clean_json_lines', None)
+
+    result = runner.run_fio_test('[job]\n', str(tmp_path / 't'), 0)
+    assert result['summary']['total_read_iops'] == 3
+
+
+def test_run_fio_test_reports_progress_from_eta_lines(fake_fio, tmp_path):
+    fake_fio(
+        "cat > /dev/null\n"
+        f"echo \"$@\" > {tmp_path / 'args'}\n"
+        "printf 'Jobs: 1 (f=1): [R(1)][-.-%%][eta 00m:02s]\\r\\n'\n"
+        "printf 'Jobs: 1 (f=1): [R(1)][50.0%%][r=1MiB/s][eta 01m:01s]\\r\\n'\n"
+        "echo '{\"jobs\": [{\"jobname\": \"j\", \"read\": {\"iops\": 3}}]}'\n"
+    )
+    runner = FioRunner()
+    updates = []
+
+    result = runner.run_fio_test('[job]\n', str(tmp_path / 't'), 0, updates.append)
+
+    assert result['summary']['total_read_iops'] == 3
+    assert [(u['progress'], u['status']) for u in updates] == [(50.0, 'running'), (100.0, 'completed')]
+    assert updates[0]['eta_seconds'] == 61
+    assert (tmp_path / 'args').read_text().split() == ['--output-format=json', '--eta=always', '--eta-newline=1', '-']
+
+
+def test_maybe_upgrade_ioengine(monkeypatch, runner):
+    monkeypatch.setattr(FioRunner, '_io_uring_supported', lambda self: True)
+
+    upgraded = runner._maybe_upgrade_ioengine('[global]\nioengine=posixaio\n[job]\nrw=read\n')
+    assert upgraded == '[global]\nioengine=io_uring\n[job]\nrw=read\n'
+
+    assert runner._maybe_upgrade_ioengine('[job]\nioengine=libaio\n') == '[job]\nioengine=io_uring\n'
+
+    # No explicit engine means FIO's own default, which is left alone
+    assert runner._maybe_upgrade_ioengine('[job]\nrw=read\n') == '[job]\nrw=read\n'
+
+    pinned = '[global]\nioengine=posixaio\n[job]\nioengine=sync\n'
+    assert runner._maybe_upgrade_ioengine(pinned) == pinned
+
+    monkeypatch.setattr(FioRunner, '_io_uring_supported', lambda self: False)
+    assert runner._maybe_upgrade_ioengine('[job]\nioengine=posixaio\n') == '[job]\nioengine=posixaio\n'
+
+
+def test_prefer_io_uring_defaults_to_runner_setting(fake_fio, monkeypatch, tmp_path):
+    import asyncio
+
+    job_file = tmp_path / 'job'
+    fake_fio(
+        f"cat > {job_file}\n"
+        "printf '%s' '{\"jobs\": []}'\n"
+    )
+    monkeypatch.setattr(FioRunner, '_io_uring_supported', lambda self: True)
+    config = '[job]\nioengine=posixaio\n'
+    runner = FioRunner(prefer_io_uring=False)
+
+    result = runner.run_fio_test(config, str(tmp_path / 't'), 0)
+    assert job_file.read_text() == config
+    assert 'ioengine_override' not in result
+
+    result = runner.run_fio_test(config, str(tmp_path / 't'), 0, prefer_io_uring=True)
+    assert job_file.read_text() == '[job]\nioengine=io_uring\n'
+    assert result['ioengine_override'] == 'io_uring'
+
+    result = asyncio.run(runner.run_fio_test_async(config, str(tmp_path / 't'), 0, prefer_io_uring=True))
+    assert result['ioengine_override'] == 'io_uring'
+
+
+def test_isolate_cpus_defaults_to_runner_setting(fake_fio, monkeypatch, tmp_path):
+    from diskbench.core import fio_runner
+
+    fake_fio(
+        "cat > /dev/null\n"
+        "printf '%s' '{\"jobs\": []}'\n"
+    )
+    isolated = []
+    monkeypatch.setattr(fio_runner, '_isolate_fio_cpus', isolated.append)
+    runner = FioRunner(isolate_cpus=True)
+
+    runner.run_fio_test('[job]\n', str(tmp_path / 't'), 0)
+    assert len(isolated) == 1
+
+    runner.run_fio_test('[job]\n', str(tmp_path / 't'), 0, isolate_cpus=False)
+    assert len(isolated) == 1
+
+
+def test_isolate_fio_cpus_leaves_first_cpu_free(monkeypatch):
+    from diskbench.core import fio_runner
+
+    calls = []
+    monkeypatch.setattr(os, 'sched_getaffinity', lambda pid: {0, 1, 2, 3}, raising=False)
+    monkeypatch.setattr(os, 'sched_setaffinity', lambda pid, cpus: calls.append((pid, cpus)), raising=False)
+
+    fio_runner._isolate_fio_cpus(1234)
+    assert calls == [(1234, [1, 2, 3])]
+
+    monkeypatch.setattr(os, 'sched_getaffinity', lambda pid: {0, 1}, raising=False)
+    fio_runner._isolate_fio_cpus(1234)
+    assert len(calls) == 1
@@ -1,3 +1,7 @@
+import os
+import threading
+import time
+from collections import namedtuple
 from types import SimpleNamespace
 
 import pytest
@@ -26,8 +30,6 @@ def test_check_fio_dependency_success(monkeypatch):
     def fake_run(cmd, capture_output, text, timeout):
         if '--version' in cmd:
             return SimpleNamespace(returncode=0, stdout='fio-3.40\n', stderr='')
-        if '--help' in cmd:
-            return SimpleNamespace(returncode=0, stdout='usage', stderr='')
         raise AssertionError(f"Unexpected command: {cmd}")
 
     monkeypatch.setattr('diskbench.core.health_checks.subprocess.run', fake_run)
@@ -60,6 +62,27 @@ def test_check_disk_space_thresholds(monkeypatch):
     assert '/Volumes/Critical' in ''.join(result.details['critical_disks'])
 
 
+def test_disk_checks_share_one_partition_scan(monkeypatch):
+    checker = SystemHealthChecker()
+    scans = []
+
+    def disk_partitions():
+        scans.append(1)
+        return [SimpleNamespace(device='/dev/disk1', mountpoint='/Volumes/OK', fstype='apfs')]
+
+    monkeypatch.setattr('diskbench.core.health_checks.psutil.disk_partitions', disk_partitions)
+    monkeypatch.setattr('diskbench.core.health_checks.psutil.disk_usage', lambda path: SimpleNamespace(
+        total=100 * 1024**3, used=90 * 1024**3, free=10 * 1024**3))
+    monkeypatch.setattr(checker, '_get_smart_data', lambda: None)
+
+    health = checker.check_disk_health()
+    space = checker.check_disk_space()
+
+    assert len(scans) == 1
+    assert health.status == space.status == HealthStatus.WARNING
+    assert space.details['disks'][0]['used_gb'] == 90
+
+
 def test_check_disk_io_performance(monkeypatch):
     checker = SystemHealthChecker()
 
@@ -76,6 +99,36 @@ def test_check_disk_io_performance(monkeypatch):
     assert 'estimated_avg_latency_ms' in result.details
 
 
+def test_rate_checks_reuse_previous_sample(monkeypatch):
+    checker = SystemHealthChecker()
+    CpuTimes = namedtuple('CpuTimes', 'user system idle iowait guest')
+    cpu_times = [CpuTimes(10, 10, 80, 0, 5), CpuTimes(40, 20, 130, 10, 25)]
+    counters = [
+        SimpleNamespace(read_bytes=0, write_bytes=0, read_count=0, write_count=0),
+        SimpleNamespace(read_bytes=100, write_bytes=0, read_count=1, write_count=0),
+        SimpleNamespace(read_bytes=300, write_bytes=100, read_count=3, write_count=1),
+    ]
+    sleeps = []
+
+    monkeypatch.setattr('diskbench.core.health_checks.psutil.cpu_percent', lambda interval: 12.0)
+    monkeypatch.setattr('diskbench.core.health_checks.psutil.cpu_times', lambda: cpu_times.pop(0))
+    monkeypatch.setattr('diskbench.core.health_checks.psutil.disk_io_counters', lambda: counters.pop(0))
+    monkeypatch.setattr('diskbench.core.health_checks.time.sleep', sleeps.append)
+
+    assert checker.check_cpu_usage().details['cpu_percent'] == 12.0
+    # 40 of 100 ticks busy: guest time is already part of user time
+    assert checker.check_cpu_usage().details['cpu_percent'] == 40.0
+
+    checker.check_disk_io_performance()
+    first_sleep = sleeps[-1]
+    result = checker.check_disk_io_performance()
+
+    assert counters == []
+    assert first_sleep == 0.5
+    assert result.details['total_io_ops'] == 3
+    assert result.details['read_ops_per_second'] > 0
+
+
 def test_check_network_connectivity(monkeypatch):
     checker = SystemHealthChecker()
 
@@ -175,3 +228,194 @@ def test_run_all_checks_with_monitor(monkeypatch):
     statuses = {res.name: res.status for res in results}
     assert statuses['cpu_usage'] == HealthStatus.CRITICAL
     assert checker.monitor.calls  # metrics logged
+
+
+_CHECK_NAMES = (
+    'disk_health', 'memory_usage', 'cpu_usage', 'disk_space', 'fio_dependency',
+    'system_temperatures', 'disk_io_performance', 'network_connectivity', 'process_health',
+)
+
+
+def test_run_all_checks_runs_checks_concurrently(monkeypatch):
+    checker = SystemHealthChecker()
+    # Every check waits for all others, so a serial loop would break the barrier
+    barrier = threading.Barrier(len(_CHECK_NAMES), timeout=5)
+
+    def make_check(name):
+        def check():
+            barrier.wait()
+            return HealthCheckResult(name, HealthStatus.HEALTHY, 'ok', {}, 0.0, 1.0)
+        return check
+
+    for name in _CHECK_NAMES:
+        monkeypatch.setattr(checker, f'check_{name}', make_check(name))
+
+    results = checker.run_all_checks()
+
+    assert [r.name for r in results] == list(_CHECK_NAMES)
+    assert all(r.status == HealthStatus.HEALTHY for r in results)
+
+
+def test_run_all_checks_reports_slow_check_as_timed_out(monkeypatch):
+    checker = SystemHealthChecker()
+    release = threading.Event()
+
+    for name in _CHECK_NAMES:
+        monkeypatch.setattr(
+            checker, f'check_{name}',
+            lambda name=name: HealthCheckResult(name, HealthStatus.HEALTHY, 'ok', {}, 0.0, 1.0)
+        )
+    monkeypatch.setattr(checker, 'check_disk_health', lambda: release.wait(5))
+    monkeypatch.setattr('diskbench.core.health_checks._CHECKS_TIMEOUT_SECONDS', 0.2)
+
+    try:
+        results = checker.run_all_checks()
+    finally:
+        release.set()
+
+    assert results[0].status == HealthStatus.UNKNOWN
+    assert 'timed out' in results[0].message
+    assert all(r.status == HealthStatus.HEALTHY for r in results[1:])
+
+
+def test_run_all_checks_reuses_results_within_ttl(monkeypatch):
+    checker = SystemHealthChecker()
+    calls = []
+
+    def make_check(name):
+        def check():
+            calls.append(name)
+            return HealthCheckResult(name, HealthStatus.HEALTHY, 'ok', {}, 0.0, 1.0)
+        return check
+
+    for name in _CHECK_NAMES:
+        monkeypatch.setattr(checker, f'check_{name}', make_check(name))
+
+    first = checker.run_all_checks()
+    second = checker.run_all_checks()
+    assert len(calls) == len(_CHECK_NAMES)
+    assert second == first
+
+    checker.invalidate('memory_usage')
+    checker.run_all_checks()
+    assert calls[len(_CHECK_NAMES):] == ['memory_usage']
+
+    checker.invalidate()
+    checker.run_all_checks()
+    assert len(calls) == 2 * len(_CHECK_NAMES) + 1
+
+
+def test_get_smart_data_queries_devices_concurrently(monkeypatch, tmp_path):
+    smartctl = tmp_path / 'smartctl'
+    smartctl.write_text(
+        "#!/bin/sh\n"
+        "if [ \"$1\" = --scan ]; then\n"
+        "  printf '/dev/disk0 -d nvme # main\\n/dev/disk1 -d ata\\n\\n/dev/disk2 -d ata\\n'\n"
+        "  exit 0\n"
+        "fi\n"
+        "sleep 0.5\n"
+        "case \"$3\" in\n"
+        "  /dev/disk0) echo '{\"smart_status\": {\"passed\": true}}' ;;\n"
+        "  /dev/disk1) echo '{\"smart_status\": {\"passed\": false}}' ;;\n"
+        "  *) echo '{\"smart_status\": {\"passed\": true}}' ;;\n"
+        "esac\n"
+    )
+    smartctl.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+    started = time.monotonic()
+    smart = SystemHealthChecker()._get_smart_data()
+
+    assert time.monotonic() - started < 1.2
+    assert smart['devices'] == ['/dev/disk0', '/dev/disk1', '/dev/disk2']
+    assert smart['health_status'] == {
+        '/dev/disk0': 'PASSED', '/dev/disk1': 'FAILED', '/dev/disk2': 'PASSED',
+    }
+    assert smart['errors'] == ['SMART health check failed for /dev/disk1']
+
+
+def test_get_smart_data_falls_back_without_json_flag(monkeypatch, tmp_path):
+    smartctl = tmp_path / 'smartctl'
+    smartctl.write_text(
+        "#!/bin/sh\n"
+        "if [ \"$1\" = --scan ]; then\n"
+        "  printf '/dev/disk0 -d ata\\n/dev/disk1 -d ata\\n'\n"
+        "  exit 0\n"
+        "fi\n"
+        "if [ \"$2\" = -j ]; then\n"
+        "  echo '=======> UNRECOGNIZED OPTION: j'\n"
+        "  exit 1\n"
+        "fi\n"
+        "case \"$2\" in\n"
+        "  /dev/disk0) echo 'SMART overall-health self-assessment test result: PASSED' ;;\n"
+        "  *) echo 'SMART overall-health self-assessment test result: FAILED!' ;;\n"
+        "esac\n"
+    )
+    smartctl.chmod(0o755)
+    monkeypatch.setenv('PATH', f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+    smart = SystemHealthChecker()._get_smart_data()
+
+    assert smart['health_status'] == {'/dev/disk0': 'PASSED', '/dev/disk1': 'FAILED'}
+    assert smart['errors'] == ['SMART health check failed for /dev/disk1']
+
+
+def test_tool_paths_are_looked_up_once(monkeypatch):
+    checker = SystemHealthChecker()
+    lookups = []
+
+    def which(name):
+        lookups.append(name)
+        return f'/opt/bin/{name}'
+
+    monkeypatch.setattr('diskbench.core.health_checks.shutil.which', which)
+
+    assert checker._fio_path == '/opt/bin/fio'
+    assert checker._fio_path == '/opt/bin/fio'
+    assert checker._smartctl_path == '/opt/bin/smartctl'
+    assert lookups == ['fio', 'smartctl']
+
+    checker.invalidate_tool_cache()
+    assert checker._fio_path == '/opt/bin/fio'
+    assert lookups == ['fio', 'smartctl', 'fio']
+
+
+def test_run_all_checks_logs_status_counts(monkeypatch):
+    class DummyMonitor:
+        def __init__(self):
+            self.metrics = {}
+
+        def log_metric(self, name, value, tags=None, unit=None):
+            self.metrics[name] = value
+
+    checker = SystemHealthChecker(monitor=DummyMonitor())
+    statuses = [HealthStatus.HEALTHY] * 5 + [HealthStatus.WARNING] * 2 + [HealthStatus.CRITICAL, HealthStatus.UNKNOWN]
+
+    for name, status in zip(_CHECK_NAMES, statuses):
+        monkeypatch.setattr(
+            checker, f'check_{name}',
+            lambda name=name, status=status: HealthCheckResult(name, status, 'ok', {}, 0.0, 1.0)
+        )
+
+    results = checker.run_all_checks()
+
+    assert checker.monitor.metrics['health_checks_healthy_count'] == 5
+    assert checker.monitor.metrics['health_checks_warning_count'] == 2
+    assert checker.monitor.metrics['health_checks_critical_count'] == 1
+    assert checker.get_health_summary(results)['overall_status'] == 'critical'
+    assert checker._determine_overall_status([]) == 'healthy'
+
+
+def test_skipped_checks_are_counted_but_do_not_affect_overall_status():
+    checker = SystemHealthChecker()
+    results = [
+        HealthCheckResult('fio_dependency', HealthStatus.HEALTHY, 'ok', {}, 0.0, 1.0),
+        HealthCheckResult('disk_space', HealthStatus.SKIPPED, 'skipped', {}, 0.0, 0.0),
+    ]
+
+    summary = checker.get_health_summary(results)
+
+    assert summary['skipped'] == 1
+    assert summary['healthy'] == 1
+    assert summary['overall_status'] == 'healthy'
+    assert checker._determine_overall_status(results[1:]) == 'healthy'
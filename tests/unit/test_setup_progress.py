@@ -0,0 +1,40 @@
+import subprocess
+from types import SimpleNamespace
+
+from diskbench.commands import setup as setup_cmd
+from diskbench.commands.setup import SetupManager, _BufferedProgress
+
+
+def test_progress_is_flushed_before_blocking_install_step(monkeypatch, capsys):
+    monkeypatch.setattr(setup_cmd, 'get_system_info', lambda: {})
+    manager = SetupManager()
+    monkeypatch.setattr(manager, '_verify_smartmontools_installation', lambda: False)
+    monkeypatch.setattr(manager, '_check_homebrew_detailed', lambda: (True, 'Homebrew 4.0'))
+    monkeypatch.setattr(manager, '_get_user_brew_command', lambda args: ['brew'] + args)
+
+    seen_before_run = []
+
+    def fake_run(cmd, **kwargs):
+        seen_before_run.append(capsys.readouterr().out)
+        return SimpleNamespace(returncode=1, stdout='', stderr='boom')
+
+    monkeypatch.setattr(setup_cmd.subprocess, 'run', fake_run)
+    progress = _BufferedProgress()
+
+    assert manager.install_smartmontools(progress) is False
+
+    assert 'Command: brew install smartmontools' in seen_before_run[0]
+    assert progress.buf  # messages after the last blocking step stay batched
+
+
+def test_shm_probe_timeout_is_not_an_shm_issue(monkeypatch):
+    monkeypatch.setattr(setup_cmd, 'get_system_info', lambda: {})
+    manager = SetupManager()
+    manager.fio_path = '/opt/fio'
+
+    def slow_run(cmd, **kwargs):
+        raise subprocess.TimeoutExpired(cmd, kwargs['timeout'])
+
+    monkeypatch.setattr(setup_cmd.subprocess, 'run', slow_run)
+
+    assert manager._test_fio_shm_support() == {'has_shm_issues': False, 'reason': 'timeout'}
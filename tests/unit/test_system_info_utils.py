@@ -119,3 +119,30 @@ def test_get_system_info_macos(monkeypatch):
     assert info['platform_version'] == 'test-version'
     assert info['macos_info']['ProductVersion'] == '14.5'
     assert info['hardware_info']['model_name'] == 'MacBook Pro'
+
+
+def test_get_cached_system_info_gathers_once(monkeypatch):
+    calls = []
+
+    def fake_get_system_info():
+        calls.append(1)
+        return {'platform': 'Darwin'}
+
+    monkeypatch.setattr(system_info, 'get_system_info', fake_get_system_info)
+    system_info._system_info_snapshot.cache_clear()
+    try:
+        first = system_info.get_cached_system_info()
+        second = system_info.get_cached_system_info()
+    finally:
+        system_info._system_info_snapshot.cache_clear()
+
+    assert first == second == {'platform': 'Darwin'}
+    assert first is not second
+    assert len(calls) == 1
+
+
+def test_local_timestamp_is_second_precision_iso():
+    from datetime import datetime
+
+    stamp = system_info.local_timestamp()
+    assert datetime.strptime(stamp, '%Y-%m-%dT%H:%M:%S').isoformat() == stamp